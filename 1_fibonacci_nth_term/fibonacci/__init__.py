@@ -0,0 +1,10 @@
+from .basic import (fib_recursive, fib_memo_recursive, fib_iterative, fib_memo, fib_matrix, fib_binet,
+                    fib_fast_doubling, fib_fast_doubling_main)
+from .recurrence import linear_recurrence_nth, tribonacci
+from .checkpoint_cache import FibCheckpointCache, fib_fast_doubling_cached
+from .batch import fib_many, fib_range
+from .modular import pisano_period, fib_mod, fib_matrix_mod, fib_mod_batch
+from .approx import fib_log10, fib_digit_count, fib_leading_digits, fib_approx
+from .export import (int_to_decimal, decimal_chunks, int_to_decimal_str, write_decimal, send_decimal,
+                     int_to_bytes, int_from_bytes, int_to_hex, write_binary, read_binary)
+from .benchmark import measure_time, sweep
@@ -0,0 +1,84 @@
+from decimal import Context, Decimal, ROUND_HALF_EVEN
+
+from .basic import fib_iterative, fib_fast_doubling
+from .modular import fib_mod
+
+
+FIB_APPROX_EXACT_BELOW = 100
+# log10(phi), F(n) has about this many digits per unit of n
+FIB_DIGITS_PER_TERM = 0.20899
+
+
+def fib_log10(n, precision=30):
+    # absolute error below 10^-precision; F(n) itself is never built for n >= FIB_APPROX_EXACT_BELOW
+    if n < 1:
+        raise ValueError("log10(F(n)) is defined for n >= 1")
+    ctx = Context(prec=precision + len(str(n)) + 10, rounding=ROUND_HALF_EVEN)
+    if n < FIB_APPROX_EXACT_BELOW:
+        return ctx.log10(Decimal(fib_iterative(n)))
+    sqrt_5 = ctx.sqrt(Decimal(5))
+    phi = ctx.divide(ctx.add(1, sqrt_5), 2)
+    # log10 F(n) = n log10(phi) - log10(sqrt 5) + log10(1 - (-1)^n phi^-2n)
+    value = ctx.subtract(ctx.multiply(Decimal(n), ctx.log10(phi)), ctx.log10(sqrt_5))
+    if 2 * n * FIB_DIGITS_PER_TERM < ctx.prec:
+        # odd n: 1 + phi^-2n, even n: 1 - phi^-2n
+        correction = ctx.power(phi, Decimal(-2 * n))
+        value = ctx.add(value, ctx.log10(ctx.subtract(1, -correction if n % 2 else correction)))
+    return value
+
+
+def fib_digit_count(n):
+    if n < FIB_APPROX_EXACT_BELOW:
+        return len(str(fib_iterative(n)))
+    # F(n) is not a power of ten, so raising the precision eventually separates
+    # log10 F(n) from the nearest integer; past the number of digits itself exact is cheaper
+    precision = 20
+    while precision < FIB_DIGITS_PER_TERM * n:
+        ctx = Context(prec=precision + len(str(n)) + 10, rounding=ROUND_HALF_EVEN)
+        log = fib_log10(n, precision)
+        eps = ctx.power(10, -precision)
+        if int(ctx.subtract(log, eps)) == int(ctx.add(log, eps)):
+            return int(log) + 1
+        precision *= 2
+    value = fib_fast_doubling(n)[0]
+    digits = int(n * FIB_DIGITS_PER_TERM)
+    while value >= 10 ** digits:
+        digits += 1
+    while digits > 1 and value < 10 ** (digits - 1):
+        digits -= 1
+    return digits
+
+
+def fib_leading_digits(n, k=10):
+    if n < FIB_APPROX_EXACT_BELOW:
+        return int(str(fib_iterative(n))[:k])
+    digits = fib_digit_count(n)
+    if k >= digits:
+        return fib_fast_doubling(n)[0]
+    precision = k + 20
+    # when F(n) ends in zeros the leading part is an exact integer and the bracket never
+    # separates, so that case is settled by divisibility and everything by a precision cap
+    trailing_zeros = None
+    while precision < FIB_DIGITS_PER_TERM * n + k:
+        ctx = Context(prec=precision + 10, rounding=ROUND_HALF_EVEN)
+        log = fib_log10(n, precision)
+        lead = ctx.power(10, ctx.add(ctx.subtract(log, int(log)), k - 1))
+        # relative error of 10^x is ln(10) times the absolute error of x
+        err = ctx.multiply(lead, ctx.power(10, 1 - precision))
+        if int(ctx.subtract(lead, err)) == int(ctx.add(lead, err)):
+            return int(lead)
+        if trailing_zeros is None:
+            trailing_zeros = fib_mod(n, 10 ** (digits - k)) == 0
+        if trailing_zeros and err < Decimal("0.5"):
+            return int(ctx.to_integral_value(lead))
+        precision *= 2
+    return fib_fast_doubling(n)[0] // 10 ** (digits - k)
+
+
+def fib_approx(n, k=10, precision=30):
+    return {
+        "digits": fib_digit_count(n),
+        "leading": fib_leading_digits(n, k),
+        "log10": fib_log10(n, precision),
+        "log10_error": Decimal(10) ** -precision,
+    }
@@ -0,0 +1,63 @@
+from decimal import Context, Decimal, ROUND_HALF_EVEN
+
+from .recurrence import FIB_COEFFS, FIB_INITIAL, linear_recurrence_nth
+
+
+def fib_recursive(n):
+    if n <= 1:
+        return n
+    return fib_recursive(n - 1) + fib_recursive(n - 2)
+
+
+def fib_memo_recursive(n, memo=None):
+    if memo is None:
+        memo = {}
+    if n <= 2:
+        return 1
+    if n not in memo:
+        memo[n] = fib_memo_recursive(n - 1, memo) + fib_memo_recursive(n - 2, memo)
+    return memo[n]
+
+
+def fib_iterative(n):
+    f_0, f_1 = 0, 1
+    for i in range(n):
+        f_0, f_1 = f_1, f_0 + f_1
+    return f_0
+
+
+def fib_memo(n):
+    memo = [0, 1]
+    for i in range(2, n + 1):
+        memo.append(memo[i - 1] + memo[i - 2])
+    return memo[n]
+
+
+def fib_matrix(n):
+    return linear_recurrence_nth(FIB_COEFFS, FIB_INITIAL, n)
+
+
+def fib_binet(n):
+    # F(n) has about 0.209 * n digits, all of them have to be significant
+    ctx = Context(prec=max(60, int(n * 0.20899) + 20), rounding=ROUND_HALF_EVEN)
+    sqrt_5 = ctx.sqrt(Decimal(5))
+    phi = ctx.divide(ctx.add(1, sqrt_5), 2)
+    psi = ctx.divide(ctx.subtract(1, sqrt_5), 2)
+
+    return int(ctx.divide(ctx.subtract(ctx.power(phi, Decimal(n)), ctx.power(psi, Decimal(n))), sqrt_5)
+               .to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def fib_fast_doubling_main(n):
+    return fib_fast_doubling(n)[0]
+
+
+def fib_fast_doubling(n):
+    if n == 0:
+        return 0, 1
+    a, b = fib_fast_doubling(n // 2)
+    c = a * (b * 2 - a)
+    d = a * a + b * b
+    if n % 2 == 0:
+        return c, d
+    return d, c + d
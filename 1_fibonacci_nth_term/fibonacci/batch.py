@@ -0,0 +1,46 @@
+from .basic import fib_fast_doubling
+from .checkpoint_cache import FIB_ADDITION_STEPS, FibCheckpointCache
+
+
+def fib_many(ns):
+    ns = list(ns)
+    if not ns:
+        return []
+    # the largest term's doubling chain leaves every prefix state of it in the cache,
+    # smaller terms then resume from those or from already computed neighbours
+    cache = FibCheckpointCache(max_bytes=None)
+    for n in sorted(set(ns), reverse=True):
+        cache.pair(n, store_path=True)
+    return [cache.checkpoints[n][0] for n in ns]
+
+
+def fib_range(a, b, step=1, chunk=None):
+    # yields F(a), F(a + step), ... up to and including F(b), or lists of up to `chunk` terms;
+    # only the current pair is kept, startup is one O(log a) doubling chain
+    if step < 1:
+        raise ValueError("step must be positive")
+    if chunk is not None:
+        batch = []
+        for value in fib_range(a, b, step):
+            batch.append(value)
+            if len(batch) == chunk:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        return
+
+    f0, f1 = fib_fast_doubling(a)
+    if step > FIB_ADDITION_STEPS:
+        fs, fs1 = fib_fast_doubling(step)
+    for k in range(a, b + 1, step):
+        yield f0
+        if k + step > b:
+            break
+        if step <= FIB_ADDITION_STEPS:
+            for _ in range(step):
+                f0, f1 = f1, f0 + f1
+        else:
+            # F(k+s) = F(k)F(s+1) + F(k+1)F(s) - F(k)F(s), F(k+s+1) = F(k+1)F(s+1) + F(k)F(s)
+            f0fs = f0 * fs
+            f0, f1 = f0 * fs1 + f1 * fs - f0fs, f1 * fs1 + f0fs
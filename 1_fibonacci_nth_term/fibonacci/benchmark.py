@@ -0,0 +1,47 @@
+import time
+import hashlib
+
+from .export import int_to_bytes
+
+
+def measure_time(func, terms):
+    times = []
+    for n in terms:
+        start = time.process_time()
+        func(n)
+        end = time.process_time()
+        times.append(end - start)
+        # times.append(timeit.timeit(lambda: func(n), number=1))
+    return times
+
+
+
+def sweep_job(func, n, result="digest"):
+    start = time.process_time()
+    value = func(n)
+    end = time.process_time()
+    # big results go back as bytes or a digest, pickling a huge int costs as much as computing it
+    if result == "digest":
+        value = hashlib.sha256(int_to_bytes(value)).hexdigest()
+    elif result == "bytes":
+        value = int_to_bytes(value)
+    elif result is None:
+        value = None
+    return end - start, value
+
+
+def sweep(algorithms, workers=None, result="digest"):
+    # algorithms: [(name, func, terms)], returns {name: times} and {name: values} in terms order
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [(name, i, func, n) for name, func, terms in algorithms for i, n in enumerate(terms)]
+    # largest n first so the slowest jobs start immediately and small ones fill the gaps
+    jobs.sort(key=lambda job: job[3], reverse=True)
+
+    times = {name: [None] * len(terms) for name, func, terms in algorithms}
+    values = {name: [None] * len(terms) for name, func, terms in algorithms}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [(name, i, executor.submit(sweep_job, func, n, result)) for name, i, func, n in jobs]
+        for name, i, future in futures:
+            times[name][i], values[name][i] = future.result()
+    return times, values
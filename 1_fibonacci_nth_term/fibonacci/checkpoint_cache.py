@@ -0,0 +1,177 @@
+import os
+import sys
+import bisect
+import pickle
+from collections import OrderedDict
+
+from .basic import fib_fast_doubling
+
+
+FIB_ADDITION_STEPS = 16
+
+
+def fib_pair_double_from(n, k, a, b):
+    # (a, b) = (F(k), F(k+1)) where k is a bit prefix of n (k == n >> shift)
+    shift = n.bit_length() - k.bit_length() if k else n.bit_length()
+    for s in range(shift - 1, -1, -1):
+        c = a * (b * 2 - a)
+        d = a * a + b * b
+        if (n >> s) & 1:
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fib_pair_shift(k, a, b, delta):
+    # (a, b) = (F(k), F(k+1)) -> (F(k+delta), F(k+delta+1)), delta may be negative
+    if 0 <= delta <= FIB_ADDITION_STEPS:
+        for _ in range(delta):
+            a, b = b, a + b
+        return a, b
+    d = abs(delta)
+    fd, fd1 = fib_fast_doubling(d)
+    if delta > 0:
+        # F(k+d) = F(k)F(d+1) + F(k+1)F(d) - F(k)F(d)
+        afd = a * fd
+        return a * fd1 + b * fd - afd, b * fd1 + afd
+    # F(k-d) = (-1)^d (F(k)F(d+1) - F(k+1)F(d)), F(k-d+1) = (-1)^(d+1) (F(k)F(d) - F(k+1)F(d-1))
+    sign = -1 if d & 1 else 1
+    return sign * (a * fd1 - b * fd), -sign * (a * fd - b * (fd1 - fd))
+
+
+class FibCheckpointCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024, path=None):
+        # max_bytes=None disables eviction
+        self.max_bytes = max_bytes
+        self.path = path
+        self.checkpoints = OrderedDict()  # k -> (F(k), F(k+1)), LRU order
+        self.keys = []  # sorted checkpoint indices for nearest lookup
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def __len__(self):
+        return len(self.checkpoints)
+
+    def __contains__(self, k):
+        return k in self.checkpoints
+
+    @staticmethod
+    def _pair_bytes(pair):
+        return sys.getsizeof(pair[0]) + sys.getsizeof(pair[1])
+
+    def put(self, k, pair):
+        if k in self.checkpoints:
+            self.checkpoints.move_to_end(k)
+            return
+        size = self._pair_bytes(pair)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        self.checkpoints[k] = pair
+        bisect.insort(self.keys, k)
+        self.size_bytes += size
+        self._evict()
+
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+        while self.size_bytes > self.max_bytes and self.checkpoints:
+            k, pair = self.checkpoints.popitem(last=False)
+            del self.keys[bisect.bisect_left(self.keys, k)]
+            self.size_bytes -= self._pair_bytes(pair)
+
+    def nearest(self, n):
+        i = bisect.bisect_left(self.keys, n)
+        candidates = self.keys[max(i - 1, 0):i + 1]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda k: abs(n - k))
+
+    def longest_prefix(self, n):
+        k = n
+        while k:
+            if k in self.checkpoints:
+                return k
+            k >>= 1
+        return 0
+
+    def pair(self, n, store_path=False):
+        cached = self.checkpoints.get(n)
+        if cached is not None:
+            self.hits += 1
+            self.checkpoints.move_to_end(n)
+            return cached
+        self.misses += 1
+
+        # prefix route: doubling steps from the longest cached bit prefix of n,
+        # costs roughly M(n) * (1 - 3^-shift) with Karatsuba multiplication
+        p = self.longest_prefix(n)
+        shift = n.bit_length() - p.bit_length()
+        prefix_cost = 1 - 3.0 ** -shift
+
+        # offset route: addition identity from the nearest checkpoint,
+        # about four n-by-d products, i.e. 4 * (d / n) ** 0.585 * M(n)
+        k = self.nearest(n)
+        offset_cost = float("inf")
+        if k is not None and n:
+            d = abs(n - k)
+            offset_cost = 0 if 0 < n - k <= FIB_ADDITION_STEPS else 4 * (d / n) ** 0.585
+
+        if offset_cost < prefix_cost:
+            a, b = self.checkpoints[k]
+            self.checkpoints.move_to_end(k)
+            result = fib_pair_shift(k, a, b, n - k)
+        elif store_path:
+            result = self._double_storing(n, p)
+        else:
+            a, b = self.checkpoints[p] if p else (0, 1)
+            result = fib_pair_double_from(n, p, a, b)
+        self.put(n, result)
+        return result
+
+    def _double_storing(self, n, p):
+        a, b = self.checkpoints[p] if p else (0, 1)
+        for s in range(n.bit_length() - p.bit_length() - 1, -1, -1):
+            c = a * (b * 2 - a)
+            d = a * a + b * b
+            if (n >> s) & 1:
+                a, b = d, c + d
+            else:
+                a, b = c, d
+            if s:
+                self.put(n >> s, (a, b))
+        return a, b
+
+    def get(self, n, store_path=False):
+        return self.pair(n, store_path)[0]
+
+    def clear(self):
+        self.checkpoints.clear()
+        self.keys = []
+        self.size_bytes = 0
+
+    def save(self, path=None):
+        path = path or self.path
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(dict(self.checkpoints), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def load(self, path=None):
+        path = path or self.path
+        with open(path, "rb") as f:
+            checkpoints = pickle.load(f)
+        for k, pair in checkpoints.items():
+            self.put(k, pair)
+
+
+fib_cache = FibCheckpointCache()
+
+
+def fib_fast_doubling_cached(n, cache=None):
+    if cache is None:
+        cache = fib_cache
+    return cache.get(n)
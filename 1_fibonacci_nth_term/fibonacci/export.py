@@ -0,0 +1,111 @@
+import io
+from decimal import Context, Decimal, ROUND_DOWN, MAX_EMAX, MAX_PREC, MIN_EMIN, Inexact
+
+
+EXPORT_BITLIM = 128
+EXPORT_CHUNK_DIGITS = 1 << 16
+
+
+def export_context():
+    ctx = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+    ctx.traps[Inexact] = True
+    return ctx
+
+
+def int_to_decimal(x, ctx=None):
+    # int division is quadratic in CPython, so split x on binary boundaries (cheap shifts)
+    # and recombine with libmpdec multiplications by cached Decimal powers of two
+    if ctx is None:
+        ctx = export_context()
+    pow2 = {}
+
+    def w2pow(w):
+        result = pow2.get(w)
+        if result is None:
+            if w <= EXPORT_BITLIM:
+                result = ctx.power(Decimal(2), w)
+            else:
+                w1 = w >> 1
+                result = ctx.multiply(w2pow(w1), w2pow(w - w1))
+            pow2[w] = result
+        return result
+
+    def inner(x, w):
+        if w <= EXPORT_BITLIM:
+            return Decimal(x)
+        w2 = w >> 1
+        hi = x >> w2
+        lo = x - (hi << w2)
+        return ctx.add(inner(lo, w2), ctx.multiply(inner(hi, w - w2), w2pow(w2)))
+
+    if x < 0:
+        return ctx.minus(inner(-x, (-x).bit_length()))
+    return inner(x, x.bit_length())
+
+
+def decimal_chunks(x, chunk_digits=EXPORT_CHUNK_DIGITS):
+    if x < 0:
+        yield "-"
+        x = -x
+    if x.bit_length() <= EXPORT_BITLIM:
+        yield str(x)
+        return
+    ctx = export_context()
+    d = int_to_decimal(x, ctx)
+    # digits are peeled off with exact scaleb/truncate splits on multiples of chunk_digits,
+    # so no string longer than one chunk is ever built
+    stack = [(d, d.adjusted() + 1, True)]
+    while stack:
+        d, width, leading = stack.pop()
+        k = width // 2 // chunk_digits * chunk_digits
+        if k == 0:
+            text = format(d, "f")
+            yield text if leading else text.zfill(width)
+            continue
+        hi = ctx.scaleb(d, -k).to_integral_value(rounding=ROUND_DOWN, context=ctx)
+        lo = ctx.subtract(d, ctx.scaleb(hi, k))
+        stack.append((lo, k, False))
+        stack.append((hi, width - k, leading))
+
+
+def int_to_decimal_str(x):
+    return "".join(decimal_chunks(x))
+
+
+def write_decimal(x, f, chunk_digits=EXPORT_CHUNK_DIGITS):
+    binary = not isinstance(f, io.TextIOBase)
+    written = 0
+    for chunk in decimal_chunks(x, chunk_digits):
+        f.write(chunk.encode("ascii") if binary else chunk)
+        written += len(chunk)
+    return written
+
+
+def send_decimal(x, sock, chunk_digits=EXPORT_CHUNK_DIGITS):
+    for chunk in decimal_chunks(x, chunk_digits):
+        sock.sendall(chunk.encode("ascii"))
+
+
+def int_to_bytes(x):
+    return x.to_bytes((x.bit_length() + 8) // 8, "big", signed=True)
+
+
+def int_from_bytes(data):
+    return int.from_bytes(data, "big", signed=True)
+
+
+def int_to_hex(x):
+    return int_to_bytes(x).hex()
+
+
+def write_binary(x, f):
+    # 8-byte big-endian length header followed by the two's complement magnitude
+    data = int_to_bytes(x)
+    f.write(len(data).to_bytes(8, "big"))
+    f.write(data)
+    return 8 + len(data)
+
+
+def read_binary(f):
+    size = int.from_bytes(f.read(8), "big")
+    return int_from_bytes(f.read(size))
@@ -0,0 +1,152 @@
+import math
+
+from .recurrence import FIB_COEFFS, FIB_INITIAL, linear_recurrence_nth
+
+
+def factorize(n):
+    factors = {}
+    d = 2
+    while d * d <= n:
+        while n % d == 0:
+            factors[d] = factors.get(d, 0) + 1
+            n //= d
+        d += 1 if d == 2 else 2
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return factors
+
+
+def fib_pair_mod(n, m):
+    a, b = 0, 1 % m
+    for s in range(n.bit_length() - 1, -1, -1):
+        c = a * (2 * b - a) % m
+        d = (a * a + b * b) % m
+        if (n >> s) & 1:
+            a, b = d, (c + d) % m
+        else:
+            a, b = c, d
+    return a, b
+
+
+def divisors(factors):
+    divs = [1]
+    for p, e in factors.items():
+        divs = [d * p ** i for d in divs for i in range(e + 1)]
+    return sorted(divs)
+
+
+def pisano_prime(p):
+    if p == 2:
+        return 3
+    if p == 5:
+        return 20
+    # pi(p) divides p - 1 when p = +-1 (mod 5) and 2(p + 1) when p = +-2 (mod 5)
+    bound = p - 1 if p % 5 in (1, 4) else 2 * (p + 1)
+    for d in divisors(factorize(bound)):
+        if fib_pair_mod(d, p) == (0, 1):
+            return d
+    return bound
+
+
+pisano_cache = {1: 1}
+
+
+def pisano_period(m):
+    if m in pisano_cache:
+        return pisano_cache[m]
+    # pi(p^k) = p^(k-1) * pi(p) (Wall's conjecture, holds for every prime checked so far)
+    period = 1
+    for p, e in factorize(m).items():
+        period = math.lcm(period, pisano_prime(p) * p ** (e - 1))
+    pisano_cache[m] = period
+    return period
+
+
+# factorising m and p +- 1 by trial division costs more than the O(log n) doubling it
+# would shorten, so n is only reduced by periods that are cached or cheap to find
+PISANO_REDUCE_MAX_MODULUS = 1 << 20
+
+
+def pisano_reduce(n, m):
+    if m in pisano_cache or m <= PISANO_REDUCE_MAX_MODULUS:
+        return n % pisano_period(m)
+    return n
+
+
+def fib_mod(n, m):
+    if m == 1:
+        return 0
+    return fib_pair_mod(pisano_reduce(n, m), m)[0]
+
+
+def fib_matrix_mod(n, m):
+    return linear_recurrence_nth(FIB_COEFFS, FIB_INITIAL, pisano_reduce(n, m), m)
+
+
+FIB_MOD_MAX_MODULUS = 1 << 32
+
+
+FIB_MOD_BATCH_CHUNK = 1 << 15
+
+
+def fib_mod_batch(ns, ms):
+    # numpy is only needed by the batch path, keep the scalar API import-light
+    import numpy as np
+
+    # products of two residues below 2^32 fit in uint64, larger moduli would overflow
+    ns = np.asarray(ns, dtype=np.uint64)
+    ms = np.asarray(ms, dtype=np.uint64)
+    ns, ms = np.broadcast_arrays(ns, ms)
+    if ms.size and (ms.min() < 1 or ms.max() >= FIB_MOD_MAX_MODULUS):
+        raise ValueError("moduli must be in [1, 2^32)")
+
+    # no Pisano reduction: n < 2^64 bounds the doubling at 64 vector steps, while
+    # finding a period is a pure Python factorisation per distinct modulus
+    shape = ns.shape
+    ns = ns.ravel()
+    ms = ms.ravel()
+    result = np.empty(ns.shape, dtype=np.uint64)
+    # chunks small enough for the working buffers to stay in cache
+    for lo in range(0, ns.size, FIB_MOD_BATCH_CHUNK):
+        hi = lo + FIB_MOD_BATCH_CHUNK
+        fib_mod_chunk(ns[lo:hi], np.ascontiguousarray(ms[lo:hi]), result[lo:hi])
+    return result.reshape(shape)
+
+
+def fib_mod_chunk(ns, ms, a):
+    import numpy as np
+
+    a[:] = 0
+    b = np.ones_like(a) % ms
+    c = np.empty_like(a)
+    d = np.empty_like(a)
+    mask = np.empty_like(a)
+    one = np.uint64(1)
+    for s in range(int(ns.max()).bit_length() - 1, -1, -1):
+        # c = a * (2b - a), d = a^2 + b^2 mod m; sums are reduced with min(x, x - m),
+        # which relies on uint64 wrap-around and avoids the slow vector modulo
+        np.add(b, b, out=c)
+        np.minimum(c, c - ms, out=c)
+        c += ms
+        c -= a
+        np.minimum(c, c - ms, out=c)
+        c *= a
+        c %= ms
+        np.multiply(a, a, out=d)
+        d %= ms
+        b *= b
+        b %= ms
+        d += b
+        np.minimum(d, d - ms, out=d)
+        # branch-free select: mask is all ones where bit s of n is set
+        np.right_shift(ns, np.uint64(s), out=mask)
+        mask &= one
+        np.negative(mask, out=mask)
+        np.add(c, d, out=b)
+        np.minimum(b, b - ms, out=b)
+        b ^= d
+        b &= mask
+        b ^= d
+        np.bitwise_xor(c, d, out=a)
+        a &= mask
+        a ^= c
@@ -0,0 +1,68 @@
+FIB_COEFFS = (1, 1)
+FIB_INITIAL = (0, 1)
+TRIBONACCI_COEFFS = (1, 1, 1)
+TRIBONACCI_INITIAL = (0, 0, 1)
+
+
+def linear_recurrence_nth(coeffs, initial, n, mod=None):
+    # a(n) = coeffs[0] * a(n-1) + ... + coeffs[k-1] * a(n-k), a(0..k-1) = initial.
+    # Kitamasa: a(n) = sum r_i * a(i) where r(x) = x^n mod (x^k - coeffs[0] x^(k-1) - ... - coeffs[k-1]),
+    # x^n is built by square-and-multiply, each step costs O(k^2) instead of a k x k matrix product
+    k = len(coeffs)
+    if k == 0 or len(initial) != k:
+        raise ValueError("need one initial term per coefficient")
+    if n < k:
+        return initial[n] % mod if mod else initial[n]
+
+    r = [0] * k
+    r[0] = 1
+    prod = [0] * (2 * k - 1)
+    for s in range(n.bit_length() - 1, -1, -1):
+        poly_square_mod(r, prod, coeffs, mod)
+        if (n >> s) & 1:
+            poly_shift_mod(r, coeffs, mod)
+
+    total = 0
+    for ri, ai in zip(r, initial):
+        total += ri * ai
+    return total % mod if mod else total
+
+
+def poly_square_mod(r, prod, coeffs, mod=None):
+    # r = r^2 mod P(x), in place, prod is a scratch buffer of length 2k - 1
+    k = len(r)
+    for i in range(2 * k - 1):
+        prod[i] = 0
+    for i in range(k):
+        ri = r[i]
+        if ri:
+            prod[2 * i] += ri * ri
+            ri2 = 2 * ri
+            for j in range(i + 1, k):
+                prod[i + j] += ri2 * r[j]
+    # x^d = coeffs[0] x^(d-1) + ... + coeffs[k-1] x^(d-k)
+    for d in range(2 * k - 2, k - 1, -1):
+        t = prod[d]
+        if mod:
+            t %= mod
+        if t:
+            for j in range(k):
+                prod[d - 1 - j] += t * coeffs[j]
+    for i in range(k):
+        r[i] = prod[i] % mod if mod else prod[i]
+
+
+def poly_shift_mod(r, coeffs, mod=None):
+    # r = x * r mod P(x), in place
+    k = len(r)
+    top = r[k - 1]
+    for i in range(k - 1, 0, -1):
+        r[i] = r[i - 1] + top * coeffs[k - 1 - i]
+    r[0] = top * coeffs[k - 1]
+    if mod:
+        for i in range(k):
+            r[i] %= mod
+
+
+def tribonacci(n, mod=None):
+    return linear_recurrence_nth(TRIBONACCI_COEFFS, TRIBONACCI_INITIAL, n, mod)
@@ -1,20 +1,31 @@
-from sorting import quick_sort, merge_sort, heap_sort, counting_sort, hybrid_sort
+from sorting import quick_sort, merge_sort, merge_sort_inplace, heap_sort, counting_sort, hybrid_sort, radix_sort
+from workloads import WORKLOADS, WORKLOAD_SEED, generate_workloads
 import numpy as np
 import time
-import matplotlib.pyplot as plt
-from prettytable import PrettyTable
+import argparse
+import os
 
 
-def generate_arrays(length):
-    return {
-        "sorted": np.arange(length),
-        "reverse sorted": np.arange(length, 0, -1),
-        "almost sorted": np.array(
-            [i if np.random.rand() > 0.03 else length - i for i in range(length)]
-        ),
-        "random": np.random.randint(0, length, size=length),
-        "few unique values": np.random.choice(range(10), size=length),
-    }
+def get_pyplot(output_dir=None):
+    # plotting is only imported when a report is drawn, a headless run writes files through Agg
+    import matplotlib
+    if output_dir is not None:
+        matplotlib.use("Agg")
+        os.makedirs(output_dir, exist_ok=True)
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def show_figure(plt, output_dir, name):
+    if output_dir is None:
+        plt.show()
+        return
+    plt.savefig(os.path.join(output_dir, name.replace(" ", "_") + ".png"), dpi=150, bbox_inches='tight')
+    plt.close()
+
+
+def generate_arrays(length, array_types=None, seed=WORKLOAD_SEED, cache_dir=None):
+    return generate_workloads(length, array_types, seed, cache_dir)
 
 
 def benchmark_algo(algo, arr):
@@ -25,10 +36,10 @@ def benchmark_algo(algo, arr):
     return end_time - start_time
 
 
-def run_benchmarks(algorithms, lengths, array_types):
+def run_benchmarks(algorithms, lengths, array_types, seed=WORKLOAD_SEED, cache_dir=None):
     results = {algo.__name__: {atype: [] for atype in array_types} for algo in algorithms}
     for size in lengths:
-        arrays = generate_arrays(size)
+        arrays = generate_arrays(size, array_types, seed, cache_dir)
         for atype, arr in arrays.items():
             for algo in algorithms:
                 time_taken = benchmark_algo(algo, arr)
@@ -36,7 +47,8 @@ def run_benchmarks(algorithms, lengths, array_types):
     return results
 
 
-def plot_results(results, sizes, array_types):
+def plot_results(results, sizes, array_types, output_dir=None):
+    plt = get_pyplot(output_dir)
     for algo, data in results.items():
         plt.figure(figsize=(10, 6))
         for atype in array_types:
@@ -46,7 +58,7 @@ def plot_results(results, sizes, array_types):
         plt.ylabel("Time (seconds)")
         plt.legend()
         plt.grid(True)
-        plt.show()
+        show_figure(plt, output_dir, f"{algo}")
 
     for atype in array_types:
         plt.figure(figsize=(10, 6))
@@ -57,10 +69,13 @@ def plot_results(results, sizes, array_types):
         plt.ylabel("Time (seconds)")
         plt.legend()
         plt.grid(True)
-        plt.show()
+        show_figure(plt, output_dir, f"comparison_{atype}")
+
 
+def display_avg_results(results, sizes, array_types, output_dir=None):
+    from prettytable import PrettyTable
 
-def display_avg_results(results, sizes, array_types):
+    plt = get_pyplot(output_dir)
     table = PrettyTable()
     table.field_names = ["Algorithm"] + [f"Size={s}" for s in sizes]
 
@@ -83,22 +98,31 @@ def display_avg_results(results, sizes, array_types):
     plt.ylabel("Time (seconds)")
     plt.legend()
     plt.grid(True)
-    plt.show()
+    show_figure(plt, output_dir, "average")
 
     print(table)
 
 
-def main():
-    algorithms = [quick_sort, merge_sort, heap_sort, counting_sort, hybrid_sort]
+def main(output_dir=None, seed=WORKLOAD_SEED, cache_dir=None):
+    algorithms = [quick_sort, merge_sort, merge_sort_inplace, heap_sort, counting_sort, hybrid_sort, radix_sort]
     sizes = [100, 1000, 5000, 10000, 20000, 40000, 60000, 100000]
-    array_types = ["sorted", "reverse sorted", "almost sorted", "random", "few unique values"]
-    results = run_benchmarks(algorithms, sizes, array_types)
-    plot_results(results, sizes, array_types)
-    display_avg_results(results, sizes, array_types)
+    array_types = list(WORKLOADS)
+    results = run_benchmarks(algorithms, sizes, array_types, seed, cache_dir)
+    plot_results(results, sizes, array_types, output_dir)
+    display_avg_results(results, sizes, array_types, output_dir)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sorting algorithms benchmark")
+    parser.add_argument("--output-dir", default=None, help="write figures here instead of showing them")
+    parser.add_argument("--seed", type=int, default=WORKLOAD_SEED, help="seed of the generated arrays")
+    parser.add_argument("--cache-dir", default=None, help="keep generated arrays here as .npy and memory-map them on reuse")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(output_dir=args.output_dir, seed=args.seed, cache_dir=args.cache_dir)
 
 # TODO: generate arrays based on type and size
 #       run benchmark for single array
@@ -1,5 +1,11 @@
 from .quick_sort import quick_sort
-from .merge_sort import merge_sort
+from .selection import select, top_k, partial_sort, nth_elements
+from .merge_sort import merge_sort, merge_sort_inplace
 from .heap_sort import heap_sort
 from .counting_sort import counting_sort
-from .hybrid_sort import hybrid_sort
\ No newline at end of file
+from .hybrid_sort import hybrid_sort, find_runs
+from .radix_sort import radix_sort
+from .parallel_merge_sort import parallel_merge_sort
+from .argsort import argsort, sort_by_key
+from .sorted_array import SortedArray
+from .external_sort import external_sort
@@ -0,0 +1,61 @@
+import numpy as np
+from .counting_sort import counting_argsort
+from .hybrid_sort import hybrid_argsort
+from .merge_sort import merge_argsort
+from .radix_sort import radix_argsort
+
+ARGSORT_METHODS = {
+    "hybrid": hybrid_argsort,
+    "merge": merge_argsort,
+    "radix": radix_argsort,
+    "counting": counting_argsort,
+}
+
+
+def argsort(data, key=None, method="hybrid"):
+    # Stable index permutation of data ordered by key. key is a field name or a list of
+    # field names of a structured array, a key array, a list of key arrays (primary first),
+    # or None to order data itself. Multi-key orders are built LSD style: a stable sort by
+    # each key from the least significant one, and only keys and indices move.
+    if method not in ARGSORT_METHODS:
+        raise ValueError(f"unknown method {method!r}, expected one of {sorted(ARGSORT_METHODS)}")
+    sorter = ARGSORT_METHODS[method]
+    keys = resolve_keys(data, key)
+
+    perm = nan_last_argsort(sorter, keys[-1])
+    for k in reversed(keys[:-1]):
+        perm = perm[nan_last_argsort(sorter, k[perm])]
+    return perm
+
+
+def nan_last_argsort(sorter, keys):
+    # NaN keys go last in input order, as with np.argsort(kind="stable"), whatever the method
+    if keys.dtype.kind == "f":
+        nan = np.isnan(keys)
+        if nan.any():
+            valid = np.flatnonzero(~nan)
+            return np.concatenate([valid[sorter(keys[valid])], np.flatnonzero(nan)])
+    return sorter(keys)
+
+
+def sort_by_key(data, key=None, method="hybrid"):
+    # payload rows are gathered once, after the permutation is known
+    return np.asarray(data)[argsort(data, key, method)]
+
+
+def resolve_keys(data, key):
+    if key is None:
+        keys = [np.asarray(data)]
+    elif isinstance(key, str):
+        keys = [np.asarray(data)[key]]
+    elif isinstance(key, (list, tuple)):
+        keys = [np.asarray(data)[k] if isinstance(k, str) else np.asarray(k) for k in key]
+    else:
+        keys = [np.asarray(key)]
+    if not keys:
+        raise ValueError("at least one key is required")
+    n = len(data)
+    for k in keys:
+        if k.ndim != 1 or len(k) != n:
+            raise ValueError("every key must be one-dimensional and as long as data")
+    return keys
@@ -1,12 +1,42 @@
 import numpy as np
+from .radix_sort import radix_sort, radix_argsort
+
+# above this many counters per element the count array costs more than a radix sort
+COUNTING_SORT_MAX_RANGE_FACTOR = 4
 
 
 def counting_sort(arr):
-    min_val = np.min(arr)
-    max_val = np.max(arr)
-    count = np.zeros(max_val - min_val + 1, dtype=int)
-    for num in arr:
-        count[num - min_val] += 1
-    sorted_arr = np.repeat(np.arange(min_val, max_val + 1), count)
+    arr = np.asarray(arr)
+    if len(arr) == 0:
+        return arr.copy()
+    if arr.dtype.kind not in "iu":
+        return radix_sort(arr)
+    min_val = int(np.min(arr))
+    max_val = int(np.max(arr))
+    value_range = max_val - min_val + 1
+    if value_range > COUNTING_SORT_MAX_RANGE_FACTOR * len(arr) + 256:
+        return radix_sort(arr)
+    count = np.bincount(key_offsets(arr, min_val).astype(np.int64), minlength=value_range)
+    sorted_arr = np.repeat(np.arange(value_range, dtype=arr.dtype) + arr.dtype.type(min_val), count)
     return sorted_arr
 
+
+def key_offsets(arr, min_val):
+    # arr - min without leaving the integers: unsigned keys subtract in their own dtype
+    # (uint64 above 2^63 does not fit int64), signed keys widen first so small dtypes
+    # cannot wrap; the result is below the value range either way
+    if arr.dtype.kind == "u":
+        return arr - arr.dtype.type(min_val)
+    return arr.astype(np.int64) - min_val
+
+
+def counting_argsort(arr):
+    # stable permutation; offsets below 2^16 are counting-sorted by NumPy's stable
+    # argsort on uint16, wider ranges go through radix_argsort
+    arr = np.asarray(arr)
+    if len(arr) == 0 or arr.dtype.kind not in "iu":
+        return radix_argsort(arr)
+    min_val = int(np.min(arr))
+    if int(np.max(arr)) - min_val >= 1 << 16:
+        return radix_argsort(arr)
+    return np.argsort(key_offsets(arr, min_val).astype(np.uint16), kind="stable")
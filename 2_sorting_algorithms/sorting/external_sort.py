@@ -0,0 +1,167 @@
+import heapq
+import os
+import shutil
+import tempfile
+import numpy as np
+from .hybrid_sort import hybrid_sort
+
+EXTERNAL_SORT_MEMORY = 256 * 1024 * 1024
+EXTERNAL_SORT_MIN_BUFFER = 1 << 12
+# measured peak of hybrid_sort per element, chunk included: the chunk, the radix key
+# copy, the int64 permutation and the gathered output
+EXTERNAL_SORT_EXTRA_BYTES = 24
+# merge memory in units of the run buffers: the buffers, the output block (every
+# buffer may drain into it at once) and the temporary of the in-place stable sort
+EXTERNAL_SORT_MERGE_COPIES = 3
+
+
+def external_sort(src, dst, dtype=None, memory_bytes=EXTERNAL_SORT_MEMORY, sorter=hybrid_sort, tmp_dir=None):
+    # src/dst are .npy files or raw binary files of dtype; returns the number of elements
+    data = open_input(src, dtype)
+    dtype = data.dtype
+    n = len(data)
+    chunk_elems = max(EXTERNAL_SORT_MIN_BUFFER, memory_bytes // (3 * dtype.itemsize + EXTERNAL_SORT_EXTRA_BYTES))
+    # runs merged at once before the buffers would drop below the minimum size
+    fan_in = max(2, memory_bytes // (EXTERNAL_SORT_MERGE_COPIES * dtype.itemsize * EXTERNAL_SORT_MIN_BUFFER))
+
+    run_dir = tempfile.mkdtemp(prefix="external_sort_", dir=tmp_dir)
+    try:
+        runs = []
+        # NaN compares false both ways and would break the heap and the merge bound,
+        # it is counted here and written after the merged runs, as np.sort places it
+        nan_count = 0
+        for lo in range(0, n, chunk_elems):
+            chunk = np.array(data[lo:lo + chunk_elems])
+            if dtype.kind == "f":
+                nan = np.isnan(chunk)
+                if nan.any():
+                    nan_count += int(np.count_nonzero(nan))
+                    chunk = chunk[~nan]
+                del nan
+            if not len(chunk):
+                continue
+            chunk = sorter(chunk)
+            path = os.path.join(run_dir, f"run_{len(runs)}.bin")
+            chunk.tofile(path)
+            runs.append((path, len(chunk)))
+            del chunk
+        del data
+
+        # extra passes only when there are more runs than the budget can buffer at once
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                path = os.path.join(run_dir, f"run_{len(runs)}_{i}.bin")
+                total = sum(length for _, length in group)
+                with open_output(path, dtype, total) as out:
+                    merge_runs(group, dtype, out, memory_bytes)
+                for old, _ in group:
+                    os.remove(old)
+                merged.append((path, total))
+            runs = merged
+
+        with open_output(dst, dtype, n) as out:
+            if runs:
+                merge_runs(runs, dtype, out, memory_bytes)
+            if nan_count:
+                nans = np.full(min(nan_count, chunk_elems), np.nan, dtype=dtype)
+                for lo in range(0, nan_count, len(nans)):
+                    out.write(nans[:nan_count - lo])
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)
+    return n
+
+
+def open_input(src, dtype=None):
+    if str(src).endswith(".npy"):
+        data = np.load(src, mmap_mode="r")
+    elif dtype is None:
+        raise ValueError("dtype is required for raw binary input")
+    elif os.path.getsize(src) == 0:
+        # mmap refuses empty files
+        data = np.empty(0, dtype=dtype)
+    else:
+        data = np.memmap(src, dtype=dtype, mode="r")
+    if data.ndim != 1:
+        raise ValueError("external_sort expects a one-dimensional array")
+    return data
+
+
+def merge_runs(runs, dtype, out, memory_bytes):
+    # k-way merge over buffered sequential reads. The heap holds the last key of every
+    # run's buffer, its minimum bounds what is safe to emit: everything <= bound in every
+    # buffer precedes all unread data, so that block is gathered and stably sorted in place.
+    k = len(runs)
+    buffer_elems = max(EXTERNAL_SORT_MIN_BUFFER,
+                       memory_bytes // (EXTERNAL_SORT_MERGE_COPIES * k * dtype.itemsize))
+    # all memory is allocated up front and reused: one buffer per run and the output block
+    bases = [np.empty(buffer_elems, dtype=dtype) for _ in range(k)]
+    block = np.empty(k * buffer_elems, dtype=dtype)
+    files = [open(path, "rb") for path, _ in runs]
+    try:
+        buffers = [fill(f, base) for f, base in zip(files, bases)]
+        heap = [(buf[-1], i) for i, buf in enumerate(buffers) if len(buf)]
+        heapq.heapify(heap)
+        while heap:
+            bound = heap[0][0]
+            m = 0
+            for r, buf in enumerate(buffers):
+                if len(buf):
+                    cut = int(np.searchsorted(buf, bound, side="right"))
+                    block[m:m + cut] = buf[:cut]
+                    m += cut
+                    buffers[r] = buf[cut:]
+            # pieces are appended in run order, a stable sort keeps ties in input order
+            emitted = block[:m]
+            emitted.sort(kind="stable")
+            out.write(emitted)
+
+            # every buffer whose last key was the bound is now empty, refill it
+            while heap and not len(buffers[heap[0][1]]):
+                _, r = heapq.heappop(heap)
+                buffers[r] = fill(files[r], bases[r])
+                if len(buffers[r]):
+                    heapq.heappush(heap, (buffers[r][-1], r))
+    finally:
+        for f in files:
+            f.close()
+
+
+def fill(f, base):
+    # reads the next block of a run into its reused buffer, returns the filled part
+    count = f.readinto(base) // base.itemsize
+    return base[:count]
+
+
+class open_output:
+    # sequential writer for a raw binary file or a .npy file with a preallocated header
+    def __init__(self, dst, dtype, n):
+        self.dst = dst
+        self.dtype = dtype
+        self.n = n
+        self.pos = 0
+
+    def __enter__(self):
+        if str(self.dst).endswith(".npy"):
+            self.array = np.lib.format.open_memmap(self.dst, mode="w+", dtype=self.dtype, shape=(self.n,))
+            self.file = None
+        else:
+            self.array = None
+            self.file = open(self.dst, "wb")
+        return self
+
+    def write(self, block):
+        if self.file is not None:
+            block.tofile(self.file)
+        else:
+            self.array[self.pos:self.pos + len(block)] = block
+        self.pos += len(block)
+
+    def __exit__(self, *exc):
+        if self.file is not None:
+            self.file.close()
+        else:
+            self.array.flush()
+            del self.array
+        return False
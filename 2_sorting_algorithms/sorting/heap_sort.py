@@ -1,25 +1,42 @@
 import numpy as np
 
+HEAP_SORT_ARITY = 4
 
-def heap_sort(arr):
-    def heapify(n, i):
-        largest = i
-        left = 2 * i + 1
-        right = 2 * i + 2
-        if left < n and arr[left] > arr[largest]:
-            largest = left
-        if right < n and arr[right] > arr[largest]:
-            largest = right
-        if largest != i:
-            arr[i], arr[largest] = arr[largest], arr[i]
-            heapify(n, largest)
 
-    n = len(arr)
-    # build maxheap
-    for i in range(n // 2 - 1, -1, -1):
-        heapify(n, i)
-    for i in range(n - 1, 0, -1):
-        arr[i], arr[0] = arr[0], arr[i]
-        heapify(i, 0)
+def heap_sort(arr, low=0, high=None, d=HEAP_SORT_ARITY):
+    # sorts arr[low:high + 1] in place with a d-ary max-heap, also the introsort fallback
+    if high is None:
+        high = len(arr) - 1
+    n = high - low + 1
+    heapify(arr, low, n, d)
+    for end in range(n - 1, 0, -1):
+        arr[low + end], arr[low] = arr[low], arr[low + end]
+        sift_down(arr, low, 0, end, d)
     return arr
 
+
+def heapify(arr, base, n, d=HEAP_SORT_ARITY):
+    # bottom-up build, O(n): sift down every internal slot, last parent first
+    for i in range((n - 2) // d, -1, -1):
+        sift_down(arr, base, i, n, d)
+
+
+def sift_down(arr, base, i, n, d=HEAP_SORT_ARITY):
+    # moves a hole down instead of swapping at every level
+    item = arr[base + i]
+    while True:
+        first = d * i + 1
+        if first >= n:
+            break
+        best = first
+        best_val = arr[base + first]
+        for c in range(first + 1, min(first + d, n)):
+            val = arr[base + c]
+            if val > best_val:
+                best = c
+                best_val = val
+        if not best_val > item:
+            break
+        arr[base + i] = best_val
+        i = best
+    arr[base + i] = item
@@ -1,50 +1,131 @@
 import numpy as np
-from .quick_sort import quick_sort, insertion_sort
+from .quick_sort import quick_sort
+from .small_sort import small_sort
+from .counting_sort import counting_sort, counting_argsort
+from .radix_sort import radix_sort, radix_argsort
+from .merge_sort import merge_argsort
 
+# consecutive wins of one run before merge switches to galloping, adapted per merge
+MIN_GALLOP = 7
+HYBRID_MIN_MERGE = 128
 
-def hybrid_sort(arr):
+# strategy selection: sample size, size below which sampling is not worth it,
+# and the cost of one interpreted per-element step relative to one vectorised one
+STRATEGY_SAMPLE_SIZE = 1024
+STRATEGY_MIN_SIZE = 256
+PYTHON_STEP_COST = 50
+# the hash route is only offered when at most this fraction of the sample is distinct
+HASH_MAX_SAMPLE_DISTINCT = 0.5
+
+
+def hybrid_sort(arr, diagnostics=None):
     def merge(left, right, left_len, right_len):
         # Allocate temporary space proportional to the smaller run
-        temp = np.empty(min(left_len, right_len), dtype=arr.dtype)
+        if left_len <= right_len:
+            merge_lo(left, right, left_len, right_len)
+        else:
+            merge_hi(left, right, left_len, right_len)
 
-        # Binary search to find the shrinking boundaries
-        left_end = left + left_len
+    def merge_lo(left, right, left_len, right_len):
+        nonlocal min_gallop
+        # Copy left run to temp
+        temp = arr[left:left + left_len].copy()
         right_end = right + right_len
+        i, j, k = 0, right, left  # i: temp, j: right run, k: destination
 
-        if left_len <= right_len:
-            # Copy left run to temp
-            temp[:] = arr[left:left + left_len]
-            i, j, k = 0, right, left  # i: temp, j: right run, k: destination
+        while i < left_len and j < right_end:
+            # One element at a time until a run wins min_gallop times in a row
+            count_a = count_b = 0
             while i < left_len and j < right_end:
-                if temp[i] <= arr[j]:
-                    arr[k] = temp[i]
-                    i += 1
-                else:
-                    arr[k] = arr[j]
+                a, b = temp[i], arr[j]
+                if b < a:
+                    arr[k] = b
                     j += 1
-                k += 1
+                    k += 1
+                    count_a = 0
+                    count_b += 1
+                    if count_b >= min_gallop:
+                        break
+                else:
+                    arr[k] = a
+                    i += 1
+                    k += 1
+                    count_b = 0
+                    count_a += 1
+                    if count_a >= min_gallop:
+                        break
 
-            # Copy any remaining elements from temp (left run)
-            remaining = left_len - i
-            if remaining > 0:
-                arr[k:k + remaining] = temp[i:i + remaining]
-        else:
-            # Copy right run to temp
-            temp[:] = arr[right:right + right_len]
-            i, j, k = left + left_len - 1, right_len - 1, right + right_len - 1
+            # Galloping: find the end of each streak and move it with one slice copy
+            while i < left_len and j < right_end:
+                count_a = gallop_forward(temp, i, left_len, arr[j], "right") - i
+                arr[k:k + count_a] = temp[i:i + count_a]
+                i += count_a
+                k += count_a
+                if i == left_len:
+                    break
+                count_b = gallop_forward(arr, j, right_end, temp[i], "left") - j
+                arr[k:k + count_b] = arr[j:j + count_b]
+                j += count_b
+                k += count_b
+                if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                    min_gallop += 1
+                    break
+                min_gallop = max(1, min_gallop - 1)
+
+        # Copy any remaining elements from temp (left run)
+        remaining = left_len - i
+        if remaining > 0:
+            arr[k:k + remaining] = temp[i:i + remaining]
+
+    def merge_hi(left, right, left_len, right_len):
+        nonlocal min_gallop
+        # Copy right run to temp
+        temp = arr[right:right + right_len].copy()
+        i, j, k = left + left_len - 1, right_len - 1, right + right_len - 1  # i: left run, j: temp
+
+        while j >= 0 and i >= left:
+            count_a = count_b = 0
             while j >= 0 and i >= left:
-                if temp[j] >= arr[i]:
-                    arr[k] = temp[j]
+                a, b = arr[i], temp[j]
+                if b >= a:
+                    arr[k] = b
                     j -= 1
+                    k -= 1
+                    count_a = 0
+                    count_b += 1
+                    if count_b >= min_gallop:
+                        break
                 else:
-                    arr[k] = arr[i]
+                    arr[k] = a
                     i -= 1
-                k -= 1
+                    k -= 1
+                    count_b = 0
+                    count_a += 1
+                    if count_a >= min_gallop:
+                        break
+
+            while j >= 0 and i >= left:
+                start = gallop_backward(temp, 0, j + 1, arr[i], "left")
+                count_b = j + 1 - start
+                arr[k - count_b + 1:k + 1] = temp[start:j + 1]
+                j -= count_b
+                k -= count_b
+                if j < 0:
+                    break
+                start = gallop_backward(arr, left, i + 1, temp[j], "right")
+                count_a = i + 1 - start
+                arr[k - count_a + 1:k + 1] = arr[start:i + 1]
+                i -= count_a
+                k -= count_a
+                if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                    min_gallop += 1
+                    break
+                min_gallop = max(1, min_gallop - 1)
 
-            # Copy any remaining elements from temp (right run)
-            remaining = j + 1  # Number of remaining elements in temp
-            if remaining > 0:
-                arr[k - remaining + 1:k + 1] = temp[:remaining]
+        # Copy any remaining elements from temp (right run)
+        remaining = j + 1  # Number of remaining elements in temp
+        if remaining > 0:
+            arr[k - remaining + 1:k + 1] = temp[:remaining]
 
     def collapse_stack():
         while len(run_stack) > 1:
@@ -68,53 +149,46 @@ def hybrid_sort(arr):
         run_stack[i] = (run_stack[i][0], run_stack[j][1])
         del run_stack[j]
 
-    def find_minrun(n):
-        r = 0
-        while n >= 64:
-            r |= n & 1
-            n >>= 1
-        return n + r
-
-    def count_unique_elements(arr):
-        return len(np.unique(arr))
+    if arr.dtype.kind == "f":
+        # NaN is unordered, sort the rest and put NaNs last like np.sort
+        nan = np.isnan(arr)
+        if nan.any():
+            k = len(arr) - int(np.count_nonzero(nan))
+            arr[:k] = hybrid_sort(arr[~nan], diagnostics)
+            arr[k:] = np.nan
+            return arr
 
-    # Check if counting sort is applicable
-    if len(arr) > 1000 and count_unique_elements(arr) / len(arr) < 0.1:
+    strategy, estimates = choose_strategy(arr)
+    if diagnostics is not None:
+        diagnostics.update(estimates)
+        diagnostics["strategy"] = strategy
+    if strategy == "counting":
+        return counting_sort(arr)
+    if strategy == "radix":
+        return radix_sort(arr)
+    if strategy == "hash":
         return counting_sort_hash(arr)
+    if strategy == "quick":
+        return quick_sort(arr)
 
     n = len(arr)
     minrun = find_minrun(n)
     run_stack = []
+    min_gallop = MIN_GALLOP
 
-    i = 0
-    while i < n:
-        # Find the next run
-        start = i
-        if i + 1 == n or arr[i] <= arr[i + 1]:
-            # Ascending run
-            while i + 1 < n and arr[i] <= arr[i + 1]:
-                i += 1
-        else:
-            # Descending run
-            while i + 1 < n and arr[i] > arr[i + 1]:
-                i += 1
-            arr[start:i + 1] = arr[start:i + 1][::-1]  # Reverse descending run
-
-        end = i
-        run_length = end - start + 1
+    # Run boundaries come from one vectorised pass, descending runs are reversed together
+    runs = find_runs(arr, minrun)
+    reverse_descending_runs(arr, runs)
 
-        # Extend short runs with insertion sort
-        if run_length < minrun:
-            insertion_sort(arr, start, min(start + minrun - 1, n - 1))
-            end = start + min(minrun - 1, n - start - 1)
-            run_length = end - start + 1
+    for start, end, natural_end, descending in runs.tolist():
+        # Extend short runs with binary insertion, the natural part is already sorted
+        if end > natural_end:
+            small_sort(arr, start, end - 1, natural_end)
 
         # Push the run onto the stack
-        run_stack.append((start, end + 1))
+        run_stack.append((start, end))
         collapse_stack()
 
-        i = end + 1
-
     # Merge all remaining runs
     while len(run_stack) > 1:
         merge_runs(len(run_stack) - 2, len(run_stack) - 1)
@@ -122,16 +196,235 @@ def hybrid_sort(arr):
     return arr
 
 
-def counting_sort_hash(arr, sorter=quick_sort):
-    count = {}
-    for num in arr:
-        count[num] = count.get(num, 0) + 1
+def find_minrun(n):
+    # binary insertion makes longer padded runs cheap, so minrun lands in [64, 128)
+    r = 0
+    while n >= HYBRID_MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def find_runs(arr, minrun=1):
+    # Run table with one row (start, end, natural_end, descending) per run, in order.
+    # arr[start:natural_end] is a natural run (non-decreasing, or strictly decreasing if
+    # descending), arr[natural_end:end] is what hybrid_sort fills up to minrun by insertion sort.
+    # With the default minrun=1 the rows are the natural runs, so len(find_runs(arr)) == 1
+    # means arr is already sorted (or strictly reversed).
+    n = len(arr)
+    if n == 0:
+        return np.empty((0, 4), dtype=np.int64)
+    if minrun <= 1:
+        return natural_runs(arr)
+
+    # padding moves the next run start, so this walk is sequential, but every
+    # iteration consumes a natural run or at least minrun elements
+    kinds = step_kinds(arr)
+    stretch_ends = np.append(np.flatnonzero(kinds[1:] != kinds[:-1]), n - 2)
+    rows = []
+    start = 0
+    while start < n:
+        kind = int(kinds[start]) if start < n - 1 else 0
+        if kind == 0:
+            natural_end = start + 1
+        else:
+            natural_end = int(stretch_ends[np.searchsorted(stretch_ends, start)]) + 2
+        end = natural_end if natural_end - start >= minrun else min(start + minrun, n)
+        rows.append((start, end, natural_end, kind < 0))
+        start = end
+    return np.array(rows, dtype=np.int64)
+
+
+def step_kinds(arr):
+    # 1 for arr[i] <= arr[i + 1], -1 for arr[i] > arr[i + 1], 0 when neither holds (NaN):
+    # such a step ends every run, it is never taken as descending
+    return (arr[:-1] <= arr[1:]).astype(np.int8) - (arr[:-1] > arr[1:])
+
+
+def natural_runs(arr):
+    # The greedy run split of find_runs without a loop per run. Steps are grouped into
+    # stretches of one kind; a run that ends a stretch swallows the first step of the next
+    # one (it joins two elements of different runs), so each stretch is entered at offset
+    # 0 or 1. The offset only depends on the previous stretch: 1 after a directional
+    # stretch of two or more steps, 0 after a NaN stretch, and it flips after a
+    # directional stretch of one step.
+    n = len(arr)
+    if n == 1:
+        return np.array([[0, 1, 1, 0]], dtype=np.int64)
+    kinds = step_kinds(arr)
+    change = np.flatnonzero(kinds[1:] != kinds[:-1]) + 1
+    first = np.r_[0, change]
+    last = np.r_[change - 1, n - 2]
+    lengths = last - first + 1
+    kind = kinds[first]
+    directional = kind != 0
+
+    idx = np.arange(len(first))
+    fixed = ~(directional & (lengths == 1))
+    after_fixed = directional.astype(np.int64)
+    prev_fixed = np.r_[-1, np.maximum.accumulate(np.where(fixed, idx, -1))[:-1]]
+    base = np.where(prev_fixed >= 0, after_fixed[prev_fixed], 0)
+    offset = base ^ ((idx - prev_fixed - 1) & 1)
+
+    # directional stretches give one run unless their only step was swallowed
+    used = directional & (offset < lengths)
+    starts = [first[used] + offset[used]]
+    ends = [last[used] + 2]
+    descending = [kind[used] < 0]
+    # NaN stretches leave every remaining element as a run of its own
+    counts = np.where(directional, 0, lengths - offset)
+    singles = np.repeat(first + offset, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    starts.append(singles)
+    ends.append(singles + 1)
+    descending.append(np.zeros(len(singles), dtype=bool))
+    if not used[-1]:
+        starts.append([n - 1])
+        ends.append([n])
+        descending.append([False])
+
+    starts = np.concatenate(starts)
+    ends = np.concatenate(ends)
+    order = np.argsort(starts, kind="stable")
+    return np.column_stack([starts, ends, ends, np.concatenate(descending)]).astype(np.int64)[order]
+
+
+def reverse_descending_runs(arr, runs):
+    desc = runs[runs[:, 3] == 1]
+    if len(desc) == 0:
+        return
+    starts = desc[:, 0]
+    lengths = desc[:, 2] - starts
+    # position inside its run for every element of every descending run
+    within = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    pos = np.repeat(starts, lengths) + within
+    mirror = np.repeat(starts + lengths - 1, lengths) - within
+    arr[pos] = arr[mirror]
+
+
+def hybrid_argsort(keys, diagnostics=None):
+    # stable permutation, the strategy is chosen the same way as in hybrid_sort
+    keys = np.asarray(keys)
+    n = len(keys)
+    if keys.dtype.kind == "f":
+        # NaN keys go last in input order, as with np.argsort(kind="stable")
+        nan = np.isnan(keys)
+        if nan.any():
+            valid = np.flatnonzero(~nan)
+            return np.concatenate([valid[hybrid_argsort(keys[valid], diagnostics)], np.flatnonzero(nan)])
+    # one natural run: sorted, or strictly decreasing so reversing keeps stability
+    if np.all(keys[:-1] <= keys[1:]):
+        return np.arange(n)
+    if np.all(keys[:-1] > keys[1:]):
+        return np.arange(n)[::-1].copy()
+
+    strategy, estimates = choose_strategy(keys)
+    if diagnostics is not None:
+        diagnostics.update(estimates)
+        diagnostics["strategy"] = strategy
+    if strategy == "counting":
+        return counting_argsort(keys)
+    if strategy == "radix":
+        return radix_argsort(keys)
+    if strategy == "hash":
+        # dense ranks of the distinct keys are small integers, counting-sort those
+        _, ranks = np.unique(keys, return_inverse=True)
+        return counting_argsort(ranks.ravel())
+    return merge_argsort(keys)
+
+
+def counting_sort_hash(arr):
+    # distinct keys and their multiplicities in one vectorised call, then one np.repeat
+    unique_keys, counts = np.unique(arr, return_counts=True)
+    return np.repeat(unique_keys, counts)
+
+
+def merge_sorted_into(out, a, b):
+    # stable vectorised merge of sorted a and b: b is searched in a (b log a), then a fills
+    # every slot b did not take in one linear masked copy, ties keep a before b
+    pos_b = np.arange(len(b)) + np.searchsorted(a, b, side="right")
+    from_a = np.ones(len(a) + len(b), dtype=bool)
+    from_a[pos_b] = False
+    out[from_a] = a
+    out[pos_b] = b
+    return out
+
+
+def choose_strategy(arr):
+    # Distinct values are estimated from a fixed-seed sample; min/max and the run structure
+    # come from exact vector reductions, which cost less than sampling enough to see rare
+    # run breaks. The costs are in units of one vectorised element operation.
+    n = len(arr)
+    estimates = {"n": n, "dtype": str(arr.dtype)}
+    if n <= STRATEGY_MIN_SIZE:
+        estimates["costs"] = {}
+        return "runs", estimates
+
+    rng = np.random.default_rng(n)
+    size = min(STRATEGY_SAMPLE_SIZE, n)
+    sample = arr[rng.integers(0, n, size=size)]
+    # GEE estimator: values seen once in the sample stand for about sqrt(n / size) distinct
+    # values each. It is a lower bound, all-distinct data reports only about sqrt(size / n) of n
+    _, sample_counts = np.unique(sample, return_counts=True)
+    singletons = int(np.count_nonzero(sample_counts == 1))
+    distinct = min(n, np.sqrt(n / size) * singletons + (len(sample_counts) - singletons))
+
+    steps = arr[:-1] <= arr[1:]
+    ascending = float(np.count_nonzero(steps)) / (n - 1)
+    # every natural run boundary flips the step direction about twice
+    runs = 1 + int(np.count_nonzero(steps[1:] != steps[:-1])) // 2
+    minrun = find_minrun(n)
+    merged_runs = min(runs, -(-n // minrun))
+    estimates.update({
+        "sample_size": size,
+        "sample_distinct": len(sample_counts),
+        "distinct_lower_bound": int(distinct),
+        "distinct_lower_bound_ratio": distinct / n,
+        "ascending_fraction": ascending,
+        "runs_estimate": runs,
+    })
+
+    log_n = np.log2(n)
+    costs = {
+        "runs": 2 * n + PYTHON_STEP_COST * n * np.log2(merged_runs),
+        "quick": PYTHON_STEP_COST * n * log_n,
+    }
+    if runs > merged_runs:
+        # short natural runs are padded to minrun by binary insertion: one interpreted step
+        # per element, the search and the memmove of about minrun / 4 items run in C
+        costs["runs"] += PYTHON_STEP_COST * n + n * (np.log2(minrun) + minrun / 4)
+    kind = arr.dtype.kind
+    if kind in "iufb":
+        if kind in "iu":
+            value_range = int(np.max(arr)) - int(np.min(arr)) + 1
+            estimates["value_range"] = value_range
+            costs["counting"] = 2 * n + value_range
+            key_bits = max(value_range.bit_length(), 1)
+        else:
+            key_bits = arr.dtype.itemsize * 8
+        costs["radix"] = 4 * n * -(-key_bits // 8)
+        if len(sample_counts) <= HASH_MAX_SAMPLE_DISTINCT * size:
+            # np.unique sorts all n keys, however few of them are distinct
+            costs["hash"] = 2 * n + n * log_n
+    estimates["costs"] = costs
+    return min(costs, key=costs.get), estimates
+
 
-    unique_keys = np.array(list(count.keys()))
-    sorted_keys = sorter(unique_keys)
+def gallop_forward(a, lo, hi, key, side):
+    # first index in a[lo:hi] with a[idx] > key ("right") or a[idx] >= key ("left"),
+    # bracketed by probing lo + 1, 3, 7, ... and finished with np.searchsorted
+    prev, ofs = lo, 1
+    while lo + ofs < hi and (a[lo + ofs - 1] <= key if side == "right" else a[lo + ofs - 1] < key):
+        prev = lo + ofs
+        ofs <<= 1
+    end = min(lo + ofs, hi)
+    return prev + int(np.searchsorted(a[prev:end], key, side=side))
 
-    sorted_arr = []
-    for key in sorted_keys:
-        sorted_arr.extend([key] * count[key])
 
-    return np.array(sorted_arr)
\ No newline at end of file
+def gallop_backward(a, lo, hi, key, side):
+    # same search, probing from the high end of a[lo:hi]
+    prev, ofs = hi, 1
+    while hi - ofs >= lo and (a[hi - ofs] > key if side == "right" else a[hi - ofs] >= key):
+        prev = hi - ofs
+        ofs <<= 1
+    start = max(hi - ofs, lo)
+    return start + int(np.searchsorted(a[start:prev], key, side=side))
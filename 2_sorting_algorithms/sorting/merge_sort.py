@@ -1,4 +1,9 @@
 import numpy as np
+from .small_sort import small_sort
+
+MERGE_SORT_LEAF = 64
+# argsort leaves still shift index by index, they prefer short runs
+MERGE_ARGSORT_LEAF = 16
 
 
 def merge_sort(arr):
@@ -17,8 +22,8 @@ def merge_sort(arr):
         return result
 
     def _merge_sort(arr):
-        if len(arr) <= 10:
-            return insertion_sort(arr)
+        if len(arr) <= MERGE_SORT_LEAF:
+            return small_sort(arr, 0, len(arr) - 1)
         mid = len(arr) // 2
         left = _merge_sort(arr[:mid])
         right = _merge_sort(arr[mid:])
@@ -27,13 +32,101 @@ def merge_sort(arr):
     return _merge_sort(arr)
 
 
-def insertion_sort(arr):
-    for i in range(1, len(arr)):
-        key = arr[i]
-        j = i - 1
-        while j >= 0 and arr[j] > key:
-            arr[j + 1] = arr[j]
-            j -= 1
-        arr[j + 1] = key
+def merge_sort_inplace(arr, workspace=None):
+    # bottom-up merge sort that ping-pongs between arr and one workspace of the same length,
+    # nothing else is allocated, so peak memory is exactly 2n elements
+    n = len(arr)
+    if workspace is None:
+        workspace = np.empty_like(arr)
+    elif len(workspace) < n or workspace.dtype != arr.dtype:
+        raise ValueError("workspace must hold at least len(arr) elements of arr.dtype")
+    workspace = workspace[:n]
+
+    for lo in range(0, n, MERGE_SORT_LEAF):
+        small_sort(arr, lo, min(lo + MERGE_SORT_LEAF, n) - 1)
+
+    src, dst = arr, workspace
+    width = MERGE_SORT_LEAF
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            merge_into(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+
+    if src is not arr:
+        arr[:] = src
     return arr
 
+
+def merge_into(src, dst, lo, mid, hi):
+    # stable merge of src[lo:mid] and src[mid:hi] into dst[lo:hi]
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        a, b = src[i], src[j]
+        if a <= b:
+            dst[k] = a
+            i += 1
+        else:
+            dst[k] = b
+            j += 1
+        k += 1
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+
+
+def merge_argsort(keys, workspace=None):
+    # merge_sort_inplace on an index permutation, only indices move, keys are only read
+    n = len(keys)
+    perm = np.arange(n)
+    if workspace is None:
+        workspace = np.empty_like(perm)
+    elif len(workspace) < n:
+        raise ValueError("workspace must hold at least len(keys) indices")
+    workspace = workspace[:n]
+
+    for lo in range(0, n, MERGE_ARGSORT_LEAF):
+        insertion_argsort(keys, perm[lo:lo + MERGE_ARGSORT_LEAF])
+
+    src, dst = perm, workspace
+    width = MERGE_ARGSORT_LEAF
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            merge_indices_into(keys, src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+    return src
+
+
+def merge_indices_into(keys, src, dst, lo, mid, hi):
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        a, b = src[i], src[j]
+        if keys[a] <= keys[b]:
+            dst[k] = a
+            i += 1
+        else:
+            dst[k] = b
+            j += 1
+        k += 1
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+
+
+def insertion_argsort(keys, perm):
+    for i in range(1, len(perm)):
+        idx = perm[i]
+        key = keys[idx]
+        j = i - 1
+        while j >= 0 and keys[perm[j]] > key:
+            perm[j + 1] = perm[j]
+            j -= 1
+        perm[j + 1] = idx
+    return perm
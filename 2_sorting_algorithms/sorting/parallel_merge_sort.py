@@ -0,0 +1,111 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from .merge_sort import merge_sort
+from .hybrid_sort import merge_sorted_into
+
+PARALLEL_MERGE_SORT_THRESHOLD = 1 << 18
+
+
+def parallel_merge_sort(arr, workers=None, sorter=merge_sort, threshold=PARALLEL_MERGE_SORT_THRESHOLD):
+    arr = np.asarray(arr)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(arr) < max(threshold, workers):
+        return sorter(np.copy(arr))
+
+    n = len(arr)
+    src_shm = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+    dst_shm = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+    try:
+        src = np.ndarray(arr.shape, dtype=arr.dtype, buffer=src_shm.buf)
+        dst = np.ndarray(arr.shape, dtype=arr.dtype, buffer=dst_shm.buf)
+        src[:] = arr
+        bounds = np.linspace(0, n, workers + 1, dtype=np.int64)
+        runs = [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # workers attach to the shared buffers by name, chunks are never pickled
+            tasks = [executor.submit(sort_chunk, src_shm.name, arr.shape, arr.dtype, lo, hi, sorter)
+                     for lo, hi in runs]
+            wait(tasks)
+            # re-raise a failed chunk sort here, the merge tree assumes sorted runs
+            for task in tasks:
+                task.result()
+
+            # merge tree: every level merges run pairs from src into dst, each pair is cut
+            # into output segments by co-ranking so that all workers stay busy up to the root
+            while len(runs) > 1:
+                tasks = []
+                merged = []
+                for p in range(0, len(runs) - 1, 2):
+                    (a_lo, a_hi), (b_lo, b_hi) = runs[p], runs[p + 1]
+                    total = b_hi - a_lo
+                    segments = max(1, round(workers * total / n))
+                    cuts = [co_rank(total * s // segments, src[a_lo:a_hi], src[b_lo:b_hi])
+                            for s in range(segments + 1)]
+                    for s in range(segments):
+                        (i0, j0), (i1, j1) = cuts[s], cuts[s + 1]
+                        tasks.append(executor.submit(
+                            merge_segment, src_shm.name, dst_shm.name, arr.shape, arr.dtype,
+                            a_lo + i0, a_lo + i1, b_lo + j0, b_lo + j1, a_lo + i0 + j0))
+                    merged.append((a_lo, b_hi))
+                if len(runs) % 2:
+                    lo, hi = runs[-1]
+                    dst[lo:hi] = src[lo:hi]
+                    merged.append(runs[-1])
+                wait(tasks)
+                for task in tasks:
+                    task.result()
+                runs = merged
+                src, dst = dst, src
+                src_shm, dst_shm = dst_shm, src_shm
+
+        result = np.array(src)
+        del src, dst
+        return result
+    finally:
+        for shm in (src_shm, dst_shm):
+            shm.close()
+            shm.unlink()
+
+
+def co_rank(k, a, b):
+    # split of the first k merged elements into a[:i] and b[:k - i], ties taken from a first
+    lo, hi = max(0, k - len(b)), min(k, len(a))
+    while True:
+        i = (lo + hi) // 2
+        j = k - i
+        if i < len(a) and j > 0 and b[j - 1] >= a[i]:
+            lo = i + 1
+        elif i > 0 and j < len(b) and a[i - 1] > b[j]:
+            hi = i - 1
+        else:
+            return i, j
+
+
+def sort_chunk(name, shape, dtype, lo, hi, sorter):
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        chunk = np.ndarray(shape, dtype=dtype, buffer=shm.buf)[lo:hi]
+        result = sorter(chunk)
+        if result is not chunk:
+            chunk[:] = result
+        del chunk
+    finally:
+        shm.close()
+
+
+def merge_segment(src_name, dst_name, shape, dtype, a_lo, a_hi, b_lo, b_hi, out_lo):
+    src_shm = shared_memory.SharedMemory(name=src_name)
+    dst_shm = shared_memory.SharedMemory(name=dst_name)
+    try:
+        src = np.ndarray(shape, dtype=dtype, buffer=src_shm.buf)
+        dst = np.ndarray(shape, dtype=dtype, buffer=dst_shm.buf)
+        a = src[a_lo:a_hi]
+        b = src[b_lo:b_hi]
+        merge_sorted_into(dst[out_lo:out_lo + len(a) + len(b)], a, b)
+        del src, dst, a, b
+    finally:
+        src_shm.close()
+        dst_shm.close()
@@ -1,29 +1,15 @@
 import numpy as np
+from .heap_sort import heap_sort
+from .small_sort import small_sort
 
 
-def quick_sort(arr):
-    def partition_three_way(low, high):
-        # random pivot turns better than median of 3
-        pivot_idx = np.random.randint(low, high + 1)
-        arr[pivot_idx], arr[high] = arr[high], arr[pivot_idx]
-
-        pivot = arr[high]
-        lt = low
-        gt = high
-        i = low
+PIVOT_BLOCK = 1024
+QUICK_SORT_LEAF = 32
 
-        while i <= gt:
-            if arr[i] < pivot:
-                arr[lt], arr[i] = arr[i], arr[lt]
-                lt += 1
-                i += 1
-            elif arr[i] > pivot:
-                arr[gt], arr[i] = arr[i], arr[gt]
-                gt -= 1
-            else:
-                i += 1
 
-        return lt, gt
+def quick_sort(arr, introsort=True):
+    if introsort:
+        return intro_sort(arr, 0, len(arr) - 1)
 
     def _quick_sort_iterative(low, high):
         stack = [(low, high)]
@@ -31,12 +17,12 @@ def quick_sort(arr):
         while stack:
             low, high = stack.pop()
 
-            if high - low <= 10:
-                insertion_sort(arr, low, high)
+            if high - low < QUICK_SORT_LEAF:
+                small_sort(arr, low, high)
                 continue
 
             if low < high:
-                lt, gt = partition_three_way(low, high)
+                lt, gt = partition_three_way(arr, low, high)
 
                 if gt - lt < high - (gt + 1):
                     stack.append((gt + 1, high))
@@ -49,12 +35,108 @@ def quick_sort(arr):
     return arr
 
 
-def insertion_sort(arr, low, high):
-    for i in range(low + 1, high + 1):
-        key = arr[i]
-        j = i - 1
-        while j >= low and arr[j] > key:
-            arr[j + 1] = arr[j]
-            j -= 1
-        arr[j + 1] = key
+def intro_sort(arr, low, high):
+    # dual-pivot quicksort with a depth budget, ranges that exhaust it go to heap_sort
+    if high <= low:
+        return arr
+    # pivots come from one block of random numbers instead of a numpy call per partition
+    block = np.random.random(PIVOT_BLOCK).tolist()
+    pos = 0
+    stack = [(low, high, 2 * (high - low + 1).bit_length())]
+
+    while stack:
+        low, high, depth = stack.pop()
+
+        if high - low < QUICK_SORT_LEAF:
+            small_sort(arr, low, high)
+            continue
+        if depth == 0:
+            heap_sort(arr, low, high)
+            continue
+
+        if pos + 5 > PIVOT_BLOCK:
+            block = np.random.random(PIVOT_BLOCK).tolist()
+            pos = 0
+        size = high - low + 1
+        sample = sorted((arr[i], i) for i in {low + int(r * size) for r in block[pos:pos + 5]})
+        pos += 5
+        # tertiles of the sample, or its median when it has collapsed
+        p_idx = sample[len(sample) // 4][1]
+        q_idx = sample[len(sample) * 3 // 4][1]
+
+        if p_idx == q_idx or arr[p_idx] == arr[q_idx]:
+            # equal pivots mean heavy duplicates, three-way partitioning handles those
+            lt, gt = partition_three_way(arr, low, high, p_idx)
+            stack.append((low, lt - 1, depth - 1))
+            stack.append((gt + 1, high, depth - 1))
+            continue
+
+        lt, gt = partition_dual_pivot(arr, low, high, p_idx, q_idx)
+        stack.append((low, lt - 1, depth - 1))
+        stack.append((gt + 1, high, depth - 1))
+        stack.append((lt + 1, gt - 1, depth - 1))
+
+    return arr
+
+
+def partition_dual_pivot(arr, low, high, p_idx, q_idx):
+    # p_idx and q_idx point at the smaller and the larger pivot
+    if q_idx == low:
+        q_idx = p_idx
+    arr[low], arr[p_idx] = arr[p_idx], arr[low]
+    arr[high], arr[q_idx] = arr[q_idx], arr[high]
+    p = arr[low]
+    q = arr[high]
+
+    lt = low + 1
+    gt = high - 1
+    i = lt
+    while i <= gt:
+        x = arr[i]
+        if x < p:
+            arr[i] = arr[lt]
+            arr[lt] = x
+            lt += 1
+        elif x > q:
+            while arr[gt] > q and i < gt:
+                gt -= 1
+            arr[i] = arr[gt]
+            arr[gt] = x
+            gt -= 1
+            x = arr[i]
+            if x < p:
+                arr[i] = arr[lt]
+                arr[lt] = x
+                lt += 1
+        i += 1
+
+    lt -= 1
+    gt += 1
+    arr[low], arr[lt] = arr[lt], arr[low]
+    arr[high], arr[gt] = arr[gt], arr[high]
+    return lt, gt
+
+
+def partition_three_way(arr, low, high, pivot_idx=None):
+    # random pivot turns better than median of 3
+    if pivot_idx is None:
+        pivot_idx = np.random.randint(low, high + 1)
+    arr[pivot_idx], arr[high] = arr[high], arr[pivot_idx]
+
+    pivot = arr[high]
+    lt = low
+    gt = high
+    i = low
+
+    while i <= gt:
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif arr[i] > pivot:
+            arr[gt], arr[i] = arr[i], arr[gt]
+            gt -= 1
+        else:
+            i += 1
 
+    return lt, gt
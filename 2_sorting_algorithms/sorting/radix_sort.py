@@ -0,0 +1,93 @@
+import numpy as np
+
+
+def radix_sort(arr, digit_bits=8):
+    # LSD radix sort on unsigned keys; each pass is a stable argsort of one digit,
+    # which NumPy itself runs as a counting/radix sort for 8 and 16 bit digits
+    arr = np.asarray(arr)
+    if len(arr) <= 1:
+        return arr.copy()
+    if digit_bits not in (8, 11, 16):
+        raise ValueError("digit_bits must be 8, 11 or 16")
+
+    keys = to_radix_keys(arr)
+    # rebasing on the minimum clears the high bits of narrow value ranges
+    base = keys.min()
+    keys -= base
+    digit_dtype = np.uint8 if digit_bits == 8 else np.uint16
+    key_bits = keys.dtype.itemsize * 8
+    mask = keys.dtype.type((1 << min(digit_bits, key_bits)) - 1)
+    # bits that are equal in every key never need a pass
+    varying = int(np.bitwise_or.reduce(keys ^ keys[0]))
+    for shift in range(0, key_bits, digit_bits):
+        if not (varying >> shift) & int(mask):
+            continue
+        digit = ((keys >> keys.dtype.type(shift)) & mask).astype(digit_dtype)
+        keys = keys[np.argsort(digit, kind="stable")]
+    keys += base
+    return from_radix_keys(keys, arr.dtype)
+
+
+def radix_argsort(arr, digit_bits=8):
+    # same passes as radix_sort, the permutation is carried along instead of the values
+    arr = np.asarray(arr)
+    perm = np.arange(len(arr))
+    if len(arr) <= 1:
+        return perm
+    if digit_bits not in (8, 11, 16):
+        raise ValueError("digit_bits must be 8, 11 or 16")
+
+    if arr.dtype.kind == "f":
+        # -0.0 and 0.0 are equal keys and must keep their input order
+        arr = arr + arr.dtype.type(0)
+    keys = to_radix_keys(arr)
+    keys -= keys.min()
+    digit_dtype = np.uint8 if digit_bits == 8 else np.uint16
+    key_bits = keys.dtype.itemsize * 8
+    mask = keys.dtype.type((1 << min(digit_bits, key_bits)) - 1)
+    varying = int(np.bitwise_or.reduce(keys ^ keys[0]))
+    for shift in range(0, key_bits, digit_bits):
+        if not (varying >> shift) & int(mask):
+            continue
+        digit = ((keys >> keys.dtype.type(shift)) & mask).astype(digit_dtype)
+        order = np.argsort(digit, kind="stable")
+        keys = keys[order]
+        perm = perm[order]
+    return perm
+
+
+def to_radix_keys(arr):
+    # order-preserving map onto unsigned integers of the same width
+    kind = arr.dtype.kind
+    if kind == "b":
+        return arr.astype(np.uint8)
+    if kind not in "uif":
+        raise TypeError(f"radix_sort does not support dtype {arr.dtype}")
+    bits = arr.dtype.itemsize * 8
+    utype = np.dtype(f"u{arr.dtype.itemsize}")
+    sign = utype.type(1 << (bits - 1))
+    if kind == "u":
+        return arr.copy()
+    keys = arr.view(utype)
+    if kind == "i":
+        # flipping the sign bit puts negatives before positives
+        return keys ^ sign
+    # floats: negatives get all bits flipped, positives only the sign bit;
+    # every NaN goes to the largest key so it sorts last like np.sort
+    negative = (keys & sign).astype(bool)
+    keys = np.where(negative, ~keys, keys | sign)
+    keys[np.isnan(arr)] = np.iinfo(utype).max
+    return keys
+
+
+def from_radix_keys(keys, dtype):
+    kind = dtype.kind
+    if kind == "b":
+        return keys.astype(bool)
+    if kind == "u":
+        return keys
+    sign = keys.dtype.type(1 << (keys.dtype.itemsize * 8 - 1))
+    if kind == "i":
+        return (keys ^ sign).view(dtype)
+    positive = (keys & sign).astype(bool)
+    return np.where(positive, keys ^ sign, ~keys).view(dtype)
@@ -0,0 +1,79 @@
+import numpy as np
+from .quick_sort import quick_sort, partition_three_way
+from .small_sort import small_sort
+
+SELECT_LEAF = 16
+
+
+def nth_elements(arr, ks):
+    # partitions arr in place so every arr[k] holds the value it would have after sorting
+    n = len(arr)
+    ranks = np.asarray(ks, dtype=np.int64)
+    ranks = np.where(ranks < 0, ranks + n, ranks)
+    if ranks.size and (ranks.min() < 0 or ranks.max() >= n):
+        raise IndexError("rank out of range")
+    wanted = np.unique(ranks)
+    if not len(wanted):
+        return np.asarray(arr)[ranks]
+
+    # introselect: random pivots while the budget lasts, then median of medians
+    stack = [(0, n - 1, 0, len(wanted), 2 * n.bit_length())]
+    while stack:
+        low, high, a, b, budget = stack.pop()
+        if high - low < SELECT_LEAF:
+            small_sort(arr, low, high)
+            continue
+
+        pivot_idx = None
+        if budget == 0:
+            pivot_idx = median_of_medians(arr, low, high)
+        else:
+            budget -= 1
+        lt, gt = partition_three_way(arr, low, high, pivot_idx)
+
+        # ranks inside [lt, gt] landed on the pivot, only recurse where ranks remain
+        left = a + int(np.searchsorted(wanted[a:b], lt))
+        right = a + int(np.searchsorted(wanted[a:b], gt, side="right"))
+        if a < left:
+            stack.append((low, lt - 1, a, left, budget))
+        if right < b:
+            stack.append((gt + 1, high, right, b, budget))
+
+    return np.asarray(arr)[ranks]
+
+
+def select(arr, k):
+    nth_elements(arr, [k])
+    return arr[k]
+
+
+def partial_sort(arr, k):
+    # the k smallest values end up sorted at the front, the rest in no particular order
+    k = min(k, len(arr))
+    if k <= 0:
+        return arr
+    if k < len(arr):
+        nth_elements(arr, [k - 1])
+    arr[:k] = quick_sort(arr[:k])
+    return arr
+
+
+def top_k(arr, k, largest=True):
+    data = np.array(arr)
+    n = len(data)
+    k = max(0, min(k, n))
+    if not largest:
+        return partial_sort(data, k)[:k].copy()
+    if k == 0:
+        return data[:0]
+    if k < n:
+        nth_elements(data, [n - k])
+    return quick_sort(data[n - k:])[::-1].copy()
+
+
+def median_of_medians(arr, low, high):
+    seg = np.array(arr[low:high + 1])
+    m = len(seg) // 5 * 5
+    medians = np.sort(seg[:m].reshape(-1, 5), axis=1)[:, 2]
+    value = select(medians, len(medians) // 2)
+    return low + int(np.flatnonzero(seg == value)[0])
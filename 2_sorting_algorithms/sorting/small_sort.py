@@ -0,0 +1,39 @@
+from bisect import bisect_right
+
+SORTING_NETWORK_MAX = 6
+
+# compare-exchange pairs, optimal in comparator count for each size
+SORTING_NETWORKS = {
+    2: ((0, 1),),
+    3: ((0, 1), (1, 2), (0, 1)),
+    4: ((0, 1), (2, 3), (0, 2), (1, 3), (1, 2)),
+    5: ((0, 1), (3, 4), (2, 4), (2, 3), (0, 3), (0, 2), (1, 4), (1, 3), (1, 2)),
+    6: ((1, 2), (4, 5), (0, 2), (3, 5), (0, 1), (3, 4), (2, 5), (0, 3), (1, 4), (2, 4), (1, 3), (2, 3)),
+}
+
+
+def small_sort(arr, low, high, start=None):
+    # sorts arr[low:high + 1] in place, arr[low:start] may already be sorted.
+    # Works on a Python list copy of the range: binary search finds the slot and
+    # del/insert shift the tail in one memmove instead of one element at a time.
+    n = high - low + 1
+    if n < 2:
+        return arr
+    run = arr[low:high + 1]
+    run = run.tolist() if hasattr(run, "tolist") else list(run)
+
+    if n <= SORTING_NETWORK_MAX:
+        for i, j in SORTING_NETWORKS[n]:
+            if run[j] < run[i]:
+                run[i], run[j] = run[j], run[i]
+    else:
+        first = 1 if start is None else max(start - low, 1)
+        for i in range(first, n):
+            x = run[i]
+            pos = bisect_right(run, x, 0, i)
+            if pos < i:
+                del run[i]
+                run.insert(pos, x)
+
+    arr[low:high + 1] = run
+    return arr
@@ -0,0 +1,74 @@
+import numpy as np
+from .hybrid_sort import hybrid_sort, merge_sorted_into
+
+SORTED_ARRAY_MIN_CAPACITY = 16
+
+
+class SortedArray:
+    # sorted buffer with spare capacity at the end; a batch is sorted on its own and
+    # merged in with one linear vectorised pass, so an insert costs O(n + b log b)
+    def __init__(self, data=None, dtype=None):
+        data = np.empty(0, dtype=dtype or np.float64) if data is None else np.array(data, dtype=dtype)
+        self.buffer = np.empty(max(len(data), SORTED_ARRAY_MIN_CAPACITY), dtype=data.dtype)
+        self.size = len(data)
+        self.buffer[:self.size] = hybrid_sort(data)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        return self.values[i]
+
+    def __array__(self, dtype=None, copy=None):
+        return self.values if dtype is None else self.values.astype(dtype)
+
+    @property
+    def values(self):
+        # read-only view of the sorted part, valid until the next insert or remove
+        view = self.buffer[:self.size]
+        view.flags.writeable = False
+        return view
+
+    def reserve(self, capacity):
+        if capacity <= len(self.buffer):
+            return
+        # geometric growth keeps the copies amortised O(1) per element
+        buffer = np.empty(max(capacity, 2 * len(self.buffer)), dtype=self.buffer.dtype)
+        buffer[:self.size] = self.buffer[:self.size]
+        self.buffer = buffer
+
+    def insert(self, batch):
+        batch = hybrid_sort(np.array(batch, dtype=self.buffer.dtype).ravel())
+        if not len(batch):
+            return self
+        n = self.size
+        self.reserve(n + len(batch))
+        data = self.buffer[:n]
+
+        # everything before the first insertion point stays where it is
+        lo = int(np.searchsorted(data, batch[0], side="right"))
+        merge_sorted_into(self.buffer[lo:n + len(batch)], data[lo:].copy(), batch)
+        self.size = n + len(batch)
+        return self
+
+    def remove(self, values):
+        # multiset removal: each given value deletes one matching element, missing ones are ignored
+        values = np.array(values, dtype=self.buffer.dtype).ravel()
+        if not len(values) or not self.size:
+            return 0
+        data = self.buffer[:self.size]
+        keys, counts = np.unique(values, return_counts=True)
+        starts = np.searchsorted(data, keys, side="left")
+        take = np.minimum(counts, np.searchsorted(data, keys, side="right") - starts)
+        total = int(take.sum())
+        if not total:
+            return 0
+
+        # positions starts[i] .. starts[i] + take[i] - 1 without a Python loop
+        offsets = np.arange(total) - np.repeat(np.cumsum(take) - take, take)
+        keep = np.ones(self.size, dtype=bool)
+        keep[np.repeat(starts, take) + offsets] = False
+        kept = data[keep]
+        self.buffer[:len(kept)] = kept
+        self.size = len(kept)
+        return total
@@ -0,0 +1,92 @@
+import os
+import zlib
+import numpy as np
+
+WORKLOAD_SEED = 20240
+ALMOST_SORTED_SWAP_RATE = 0.03
+FEW_UNIQUE_VALUES = 10
+ZIPF_EXPONENT = 1.5
+SAWTOOTH_TEETH = 16
+MANY_RUNS_LENGTH = 32
+HEAVY_DUPLICATE_RATE = 0.9
+NAN_RATE = 0.01
+
+
+def almost_sorted(rng, length):
+    a = np.arange(length)
+    moved = rng.random(length) <= ALMOST_SORTED_SWAP_RATE
+    a[moved] = length - a[moved]
+    return a
+
+
+def zipf(rng, length):
+    # a handful of values dominate, the tail is capped so the range stays O(n)
+    return np.minimum(rng.zipf(ZIPF_EXPONENT, size=length), length)
+
+
+def sawtooth(rng, length):
+    return np.arange(length) % max(1, -(-length // SAWTOOTH_TEETH))
+
+
+def organ_pipe(rng, length):
+    i = np.arange(length)
+    return np.minimum(i, length - 1 - i)
+
+
+def many_runs(rng, length):
+    # random values sorted inside segments of geometric length (mean MANY_RUNS_LENGTH)
+    values = rng.integers(0, max(length, 1), size=length)
+    segment = np.cumsum(rng.random(length) < 1 / MANY_RUNS_LENGTH)
+    return values[np.lexsort((values, segment))]
+
+
+def heavy_duplicates(rng, length):
+    values = rng.integers(0, max(length, 1), size=length)
+    values[rng.random(length) < HEAVY_DUPLICATE_RATE] = length // 2
+    return values
+
+
+def floats_with_nan(rng, length):
+    values = rng.standard_normal(length)
+    values[rng.random(length) < NAN_RATE] = np.nan
+    return values
+
+
+WORKLOADS = {
+    "sorted": lambda rng, length: np.arange(length),
+    "reverse sorted": lambda rng, length: np.arange(length, 0, -1),
+    "almost sorted": almost_sorted,
+    "random": lambda rng, length: rng.integers(0, max(length, 1), size=length),
+    "few unique values": lambda rng, length: rng.integers(0, FEW_UNIQUE_VALUES, size=length),
+    "zipf": zipf,
+    "sawtooth": sawtooth,
+    "organ pipe": organ_pipe,
+    "many runs": many_runs,
+    "heavy duplicates": heavy_duplicates,
+    "floats": lambda rng, length: rng.standard_normal(length),
+    "floats with nan": floats_with_nan,
+}
+
+
+def generate_workload(kind, length, seed=WORKLOAD_SEED, cache_dir=None):
+    # every (kind, length, seed) has its own stream, so arrays do not depend on generation order
+    if cache_dir is not None:
+        path = os.path.join(cache_dir, f"{kind.replace(' ', '_')}_{length}_{seed}.npy")
+        if os.path.exists(path):
+            return np.load(path, mmap_mode="r")
+
+    rng = np.random.default_rng([seed, length, zlib.crc32(kind.encode())])
+    arr = WORKLOADS[kind](rng, length)
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write then rename, a concurrent or interrupted run never sees a partial file
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, arr)
+        os.replace(tmp, path)
+    return arr
+
+
+def generate_workloads(length, kinds=None, seed=WORKLOAD_SEED, cache_dir=None):
+    return {kind: generate_workload(kind, length, seed, cache_dir) for kind in kinds or WORKLOADS}
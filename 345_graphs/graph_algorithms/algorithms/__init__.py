@@ -1,8 +1,8 @@
 from .floyd_warshall import floyd
 from .prim import prim
-from .bfs import bfs
+from .bfs import bfs, bfs_levels
 from .kruskal import kruskal
 from .dfs import dfs
 from .dijkstra import dijkstra
 
-__all__ = ["floyd", "prim", "bfs", "kruskal", "dfs", "dijkstra"]
+__all__ = ["floyd", "prim", "bfs", "bfs_levels", "kruskal", "dfs", "dijkstra"]
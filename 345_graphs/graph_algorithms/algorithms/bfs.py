@@ -1,5 +1,9 @@
 from collections import deque
 
+import numpy as np
+
+from ..utils.CSRGraph import CSRGraph
+
 
 def bfs(graph, num_nodes, start=0):  # index based
     visited = [False] * num_nodes
@@ -13,3 +17,57 @@ def bfs(graph, num_nodes, start=0):  # index based
                 visited[neighbor] = True
                 queue.append(neighbor)
     return [i for i, v in enumerate(visited) if v]
+
+
+def bfs_levels(graph, num_nodes=None, start=0, symmetric=False, diagnostics=None):
+    # level-synchronous BFS over CSR arrays: each level is a handful of gathers instead of
+    # one interpreted step per node. Returns dist (-1 when unreachable) and parent
+    # (-1 for start and unreachable nodes) arrays.
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph, num_nodes, weighted=False)
+    n = graph.num_nodes
+    dist = np.full(n, -1, dtype=np.int64)
+    parent = np.full(n, -1, dtype=np.int64)
+    dist[start] = 0
+    # bottom-up needs in-edges: they come from the transpose on first use, unless the caller
+    # asserts the adjacency is symmetric (undirected) and the graph is its own reverse
+    reverse = graph if symmetric else None
+    out_degree = graph.degrees()
+    in_degree = out_degree if symmetric else np.bincount(graph.indices, minlength=n)
+
+    frontier = np.array([start], dtype=np.int64)
+    unvisited_edges = int(in_degree.sum()) - int(in_degree[start])
+    level = 0
+    directions = []
+    while len(frontier):
+        frontier_edges = int(out_degree[frontier].sum())
+        # direction optimizing: a vectorised bottom-up step has no early exit, so it pays
+        # as soon as the unvisited nodes have fewer edges than the frontier
+        if unvisited_edges < frontier_edges:
+            if reverse is None:
+                reverse = graph.transpose()
+            in_frontier = dist == level
+            unvisited = np.flatnonzero(dist < 0)
+            nodes, nbrs = reverse.gather(unvisited)
+            hit = in_frontier[nbrs]
+            nodes, nbrs = nodes[hit], nbrs[hit]
+            # edges come grouped by node, the first hit of every node is its parent
+            first = np.flatnonzero(np.r_[True, nodes[1:] != nodes[:-1]]) if len(nodes) else nodes
+            frontier = nodes[first]
+            parent[frontier] = nbrs[first]
+            directions.append("bottom-up")
+        else:
+            srcs, nbrs = graph.gather(frontier)
+            new = dist[nbrs] < 0
+            frontier, first = np.unique(nbrs[new], return_index=True)
+            parent[frontier] = srcs[new][first]
+            directions.append("top-down")
+
+        level += 1
+        dist[frontier] = level
+        unvisited_edges -= int(in_degree[frontier].sum())
+
+    if diagnostics is not None:
+        diagnostics["levels"] = level
+        diagnostics["directions"] = directions
+    return dist, parent
@@ -1,20 +1,27 @@
-import heapq
+from ..utils.CSRGraph import CSRGraph
+from ..utils.IndexedHeap import IndexedHeap, HEAP_ARITY
 
 
-def dijkstra(graph, start=0):
-    dist = {node: float('inf') for node in graph}
-    prev = {node: -1 for node in graph}
+def dijkstra(graph, num_nodes=None, start=0, d=HEAP_ARITY):
+    if num_nodes is None and isinstance(graph, CSRGraph):
+        num_nodes = graph.num_nodes
+    elif num_nodes is None:
+        num_nodes = 1 + max((max([u, *nbrs]) for u, nbrs in graph.items()), default=start)
+    dist = [float('inf')] * num_nodes
+    prev = [-1] * num_nodes
+    # settled nodes never re-enter the heap, so it holds at most one entry per node
+    done = [False] * num_nodes
     dist[start] = 0
-    heap = [(0, start)]
+    heap = IndexedHeap(num_nodes, d)
+    heap.push(start, 0)
 
     while heap:
-        curr_dist, u = heapq.heappop(heap)
-        if curr_dist > dist[u]:
-            continue
+        u, curr_dist = heap.pop()
+        done[u] = True
         for v, weight in graph.get(u, {}).items():
             new_dist = curr_dist + weight
-            if new_dist < dist[v]:
+            if new_dist < dist[v] and not done[v]:
                 dist[v] = new_dist
                 prev[v] = u
-                heapq.heappush(heap, (new_dist, v))
-    return dist, prev
+                heap.push_or_decrease(v, new_dist)
+    return dict(enumerate(dist)), dict(enumerate(prev))
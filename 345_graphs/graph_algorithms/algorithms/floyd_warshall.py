@@ -1,5 +1,7 @@
 import numpy as np
 
+from ..utils.CSRGraph import CSRGraph
+
 
 def floyd(graph, num_nodes):
     INF = float('inf')
@@ -10,10 +12,16 @@ def floyd(graph, num_nodes):
         dist[i, i] = 0
         prev[i, i] = -1
 
-    for u in range(num_nodes):
-        for v, w in graph.get(u, {}).items():
-            dist[u, v] = w
-            prev[u, v] = u
+    if isinstance(graph, CSRGraph):
+        # all edges in one scatter
+        rows = graph.sources()
+        dist[rows, graph.indices] = graph.weights
+        prev[rows, graph.indices] = rows
+    else:
+        for u in range(num_nodes):
+            for v, w in graph.get(u, {}).items():
+                dist[u, v] = w
+                prev[u, v] = u
 
     for k in range(num_nodes):
         new_dist = np.minimum(dist, dist[:, [k]] + dist[[k], :])
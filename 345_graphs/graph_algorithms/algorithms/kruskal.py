@@ -1,18 +1,13 @@
+import numpy as np
+
+from ..utils.CSRGraph import CSRGraph
+
+
 def kruskal(graph, num_nodes):
-    edges = []
-    node_to_idx = {}
-    idx = 0
-    for u in graph:
-        if u not in node_to_idx:
-            node_to_idx[u] = idx
-            idx += 1
-        for v, w in graph[u].items():
-            if v not in node_to_idx:
-                node_to_idx[v] = idx
-                idx += 1
-            if u < v:
-                edges.append((w, u, v))
-    edges.sort()
+    if isinstance(graph, CSRGraph):
+        edges, node_to_idx, idx = csr_edges(graph)
+    else:
+        edges, node_to_idx, idx = dict_edges(graph)
 
     parent = list(range(idx))
     rank = [0] * idx
@@ -45,3 +40,31 @@ def kruskal(graph, num_nodes):
             total_weight += w
 
     return mst_edges, total_weight
+
+
+def dict_edges(graph):
+    edges = []
+    node_to_idx = {}
+    idx = 0
+    for u in graph:
+        if u not in node_to_idx:
+            node_to_idx[u] = idx
+            idx += 1
+        for v, w in graph[u].items():
+            if v not in node_to_idx:
+                node_to_idx[v] = idx
+                idx += 1
+            if u < v:
+                edges.append((w, u, v))
+    edges.sort()
+    return edges, node_to_idx, idx
+
+
+def csr_edges(graph):
+    # same (w, u, v) order as sorting the tuples, done with one lexsort; nodes are their own index
+    u = graph.sources()
+    keep = u < graph.indices
+    u, v, w = u[keep], graph.indices[keep], graph.weights[keep]
+    order = np.lexsort((v, u, w))
+    edges = zip(w[order].tolist(), u[order].tolist(), v[order].tolist())
+    return edges, range(graph.num_nodes), graph.num_nodes
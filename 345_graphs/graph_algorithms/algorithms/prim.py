@@ -1,7 +1,7 @@
-import heapq
+from ..utils.IndexedHeap import IndexedHeap, HEAP_ARITY
 
 
-def prim(graph, num_nodes, start=0):
+def prim(graph, num_nodes, start=0, d=HEAP_ARITY):
     if num_nodes == 0:
         return [], 0
 
@@ -9,22 +9,24 @@ def prim(graph, num_nodes, start=0):
     mst_edges = []
     total_cost = 0
 
-    heap = []
-    visited[start] = True
-
-    for neighbor, weight in graph.get(start, {}).items():
-        if not visited[neighbor]:
-            heapq.heappush(heap, (weight, start, neighbor))
+    # best[v] is the cheapest known edge (parent[v], v) into the tree, one heap entry per node
+    best = [float('inf')] * num_nodes
+    parent = [-1] * num_nodes
+    heap = IndexedHeap(num_nodes, d)
+    best[start] = 0
+    heap.push(start, 0)
 
     while heap and len(mst_edges) < num_nodes - 1:
-        weight, u, v = heapq.heappop(heap)
-        if not visited[v]:
-            visited[v] = True
-            mst_edges.append((u, v, weight))
+        v, weight = heap.pop()
+        visited[v] = True
+        if parent[v] >= 0:
+            mst_edges.append((parent[v], v, weight))
             total_cost += weight
 
-            for neighbor, w in graph.get(v, {}).items():
-                if not visited[neighbor]:
-                    heapq.heappush(heap, (w, v, neighbor))
+        for neighbor, w in graph.get(v, {}).items():
+            if not visited[neighbor] and w < best[neighbor]:
+                best[neighbor] = w
+                parent[neighbor] = v
+                heap.push_or_decrease(neighbor, w)
 
     return mst_edges, total_cost
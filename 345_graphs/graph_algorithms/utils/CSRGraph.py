@@ -0,0 +1,102 @@
+from itertools import chain
+
+import numpy as np
+
+
+class CSRGraph:
+    # compressed sparse row adjacency: the neighbours of u are indices[indptr[u]:indptr[u + 1]]
+    # with matching weights. Indexing a node returns the same shape as the dict graphs
+    # (a {neighbor: weight} dict, or a neighbour list when unweighted), so the algorithms
+    # accept it directly; the ones with a vectorised kernel check for CSRGraph first.
+    def __init__(self, indptr, indices, weights=None):
+        self.indptr = np.asarray(indptr)
+        self.indices = np.asarray(indices)
+        self.weights = None if weights is None else np.asarray(weights)
+        if len(self.indptr) == 0 or self.indptr[-1] != len(self.indices):
+            raise ValueError("indptr must start a row for every node and end at len(indices)")
+        if self.weights is not None and len(self.weights) != len(self.indices):
+            raise ValueError("weights must have one entry per edge")
+
+    @classmethod
+    def from_dict(cls, graph, num_nodes=None, weighted=True, index_dtype=np.int32, weight_dtype=np.float32):
+        if num_nodes is None:
+            num_nodes = 1 + max((max(u, max(nbrs, default=u)) for u, nbrs in graph.items()), default=-1)
+        degrees = np.zeros(num_nodes, dtype=np.int64)
+        for u, nbrs in graph.items():
+            degrees[u] = len(nbrs)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(degrees, out=indptr[1:])
+        if indptr[-1] <= np.iinfo(index_dtype).max:
+            indptr = indptr.astype(index_dtype)
+
+        rows = [graph[u] for u in range(num_nodes) if u in graph]
+        indices = np.fromiter(chain.from_iterable(rows), dtype=index_dtype, count=int(indptr[-1]))
+        weights = None
+        if weighted:
+            weights = np.fromiter(chain.from_iterable(row.values() for row in rows),
+                                  dtype=weight_dtype, count=int(indptr[-1]))
+        return cls(indptr, indices, weights)
+
+    @property
+    def num_nodes(self):
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.indices)
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.indices.nbytes + (0 if self.weights is None else self.weights.nbytes)
+
+    def degrees(self):
+        return np.diff(self.indptr)
+
+    def sources(self):
+        # the row of every edge, aligned with indices and weights
+        return np.repeat(np.arange(self.num_nodes, dtype=self.indices.dtype), self.degrees())
+
+    def gather(self, nodes):
+        # all edges leaving nodes as (source, neighbor) arrays, in row order, without a Python loop
+        nodes = np.asarray(nodes, dtype=np.int64)
+        starts = self.indptr[nodes].astype(np.int64)
+        counts = self.indptr[nodes + 1] - starts
+        total = int(counts.sum())
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        return np.repeat(nodes, counts), self.indices[offsets]
+
+    def transpose(self):
+        # in-edges as rows, a stable sort keeps each new row ordered by source
+        order = np.argsort(self.indices, kind="stable")
+        indptr = np.zeros(self.num_nodes + 1, dtype=self.indptr.dtype)
+        np.cumsum(np.bincount(self.indices, minlength=self.num_nodes), out=indptr[1:])
+        weights = None if self.weights is None else self.weights[order]
+        return CSRGraph(indptr, self.sources()[order], weights)
+
+    def unweighted(self):
+        return CSRGraph(self.indptr, self.indices)
+
+    def __len__(self):
+        return self.num_nodes
+
+    def __contains__(self, u):
+        return 0 <= u < self.num_nodes
+
+    def __iter__(self):
+        return iter(range(self.num_nodes))
+
+    def keys(self):
+        return range(self.num_nodes)
+
+    def items(self):
+        return ((u, self[u]) for u in range(self.num_nodes))
+
+    def __getitem__(self, u):
+        lo, hi = self.indptr[u], self.indptr[u + 1]
+        nbrs = self.indices[lo:hi].tolist()
+        if self.weights is None:
+            return nbrs
+        return dict(zip(nbrs, self.weights[lo:hi].tolist()))
+
+    def get(self, u, default=None):
+        return self[u] if u in self else default
@@ -1,9 +1,11 @@
 import random
-import networkx as nx
 import numpy as np
 
+from .CSRGraph import CSRGraph
+
 
 class Graph:
+    # networkx is imported inside the generators only, the algorithms never need it
     def __init__(self):
         # Dictionary of dictionaries: node -> {neighbor: weight}
         self.graph = {}
@@ -26,14 +28,20 @@ class Graph:
                 self.graph[v][u] = weight
 
     def regular(self, n, degree=3):
+        import networkx as nx
+
         G = nx.random_regular_graph(d=degree, n=n, seed=random.randint(0, 1000))
         self._convert_from_nx(G)
 
     def complete(self, n):
+        import networkx as nx
+
         G = nx.complete_graph(n)
         self._convert_from_nx(G)
 
     def sparse(self, n, p=0.1):
+        import networkx as nx
+
         max_attempts = 10
         for attempt in range(max_attempts):
             G = nx.erdos_renyi_graph(n=n, p=p, seed=random.randint(0, 1000))
@@ -49,6 +57,8 @@ class Graph:
         self._convert_from_nx(G)
 
     def dense(self, n, p=0.8):
+        import networkx as nx
+
         G = nx.erdos_renyi_graph(n=n, p=p, seed=random.randint(0, 1000))
         if not nx.is_connected(G):
             components = list(nx.connected_components(G))
@@ -59,10 +69,14 @@ class Graph:
         self._convert_from_nx(G)
 
     def directed(self, n, p=0.5):
+        import networkx as nx
+
         G = nx.gnp_random_graph(n=n, p=p, directed=True, seed=random.randint(0, 1000))
         self._convert_from_nx(G, directed=True)
 
     def bipartite(self, n):
+        import networkx as nx
+
         n1 = n // 2
         n2 = n - n1
         G = nx.bipartite.random_graph(n1, n2, p=0.5, seed=random.randint(0, 1000))
@@ -75,10 +89,14 @@ class Graph:
         self._convert_from_nx(G)
 
     def cycle(self, n):
+        import networkx as nx
+
         G = nx.cycle_graph(n)
         self._convert_from_nx(G)
 
     def with_cyclic_subgraph(self, n):
+        import networkx as nx
+
         G = nx.gnm_random_graph(n=n, m=n + 1, seed=random.randint(0, 1000))
         if not nx.is_connected(G):
             components = list(nx.connected_components(G))
@@ -89,18 +107,26 @@ class Graph:
         self._convert_from_nx(G)
 
     def acyclic(self, n):
+        import networkx as nx
+
         G = nx.random_tree(n=n, seed=random.randint(0, 1000))
         self._convert_from_nx(G)
 
     def shallow_wide_tree(self, n):
+        import networkx as nx
+
         G = nx.star_graph(range(n))
         self._convert_from_nx(G)
 
     def deep_narrow_tree(self, n):
+        import networkx as nx
+
         G = nx.path_graph(n)
         self._convert_from_nx(G)
 
     def with_self_loops(self, n):
+        import networkx as nx
+
         G = nx.erdos_renyi_graph(n=n, p=0.3, seed=random.randint(0, 1000))
         if not nx.is_connected(G):
             components = list(nx.connected_components(G))
@@ -114,6 +140,8 @@ class Graph:
         self._convert_from_nx(G)
 
     def grid(self, n):
+        import networkx as nx
+
         side = int(np.ceil(np.sqrt(n)))
         G = nx.grid_2d_graph(side, side)
         mapping = {(i, j): i * side + j for i in range(side) for j in range(side)}
@@ -121,6 +149,8 @@ class Graph:
         self._convert_from_nx(G)
 
     def with_negative_weights(self, n):
+        import networkx as nx
+
         G = nx.erdos_renyi_graph(n=n, p=0.5, seed=random.randint(0, 1000))
         if not nx.is_connected(G):
             components = list(nx.connected_components(G))
@@ -131,10 +161,14 @@ class Graph:
         self._convert_from_nx(G, allow_negative_weights=True)
 
     def scale_free(self, n):
+        import networkx as nx
+
         G = nx.barabasi_albert_graph(n=n, m=2, seed=random.randint(0, 1000))
         self._convert_from_nx(G)
 
     def random(self, n):
+        import networkx as nx
+
         G = nx.erdos_renyi_graph(n=n, p=0.5, seed=random.randint(0, 1000))
         if not nx.is_connected(G):
             components = list(nx.connected_components(G))
@@ -157,6 +191,10 @@ class Graph:
                 unweighted_graph[u] = neighbors
         return unweighted_graph
 
+    def to_csr(self, weighted=True, index_dtype=np.int32, weight_dtype=np.float32):
+        # a few bytes per edge instead of a dict entry, nodes are 0..max id
+        return CSRGraph.from_dict(self.graph, weighted=weighted, index_dtype=index_dtype, weight_dtype=weight_dtype)
+
     def print_graph(self):
         for u in sorted(self.graph):
             neighbors = ', '.join(f"{v}: {self.graph[u][v]}" for v in sorted(self.graph[u]))
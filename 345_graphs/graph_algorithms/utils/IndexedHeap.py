@@ -0,0 +1,106 @@
+HEAP_ARITY = 4
+
+
+class IndexedHeap:
+    # d-ary min-heap over items 0..capacity-1; pos[item] is the item's slot in heap
+    # (-1 when absent), so decrease_key finds an item in O(1) and the heap never holds
+    # more than one entry per item
+    def __init__(self, capacity, d=HEAP_ARITY):
+        if d < 2:
+            raise ValueError("heap arity must be at least 2")
+        self.d = d
+        self.heap = []
+        self.key = [0] * capacity
+        self.pos = [-1] * capacity
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return self.pos[item] >= 0
+
+    def heapify(self, items, keys):
+        # bulk build in O(n): sift down every internal slot, last parent first
+        for item in self.heap:
+            self.pos[item] = -1
+        self.heap = list(items)
+        for i, (item, key) in enumerate(zip(self.heap, keys)):
+            self.key[item] = key
+            self.pos[item] = i
+        for i in range((len(self.heap) - 2) // self.d, -1, -1):
+            self._sift_down(i)
+
+    def push(self, item, key):
+        if self.pos[item] >= 0:
+            raise ValueError(f"item {item} is already in the heap")
+        self.key[item] = key
+        self.heap.append(item)
+        self.pos[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, item, key):
+        if key > self.key[item]:
+            raise ValueError(f"new key {key} is larger than the current key of item {item}")
+        self.key[item] = key
+        self._sift_up(self.pos[item])
+
+    def push_or_decrease(self, item, key):
+        # returns True when the heap changed
+        if self.pos[item] < 0:
+            self.push(item, key)
+            return True
+        if key < self.key[item]:
+            self.decrease_key(item, key)
+            return True
+        return False
+
+    def pop(self):
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.pos[top] = -1
+        if heap:
+            heap[0] = last
+            self.pos[last] = 0
+            self._sift_down(0)
+        return top, self.key[top]
+
+    def _sift_up(self, i):
+        # move a hole up instead of swapping at every level
+        heap, key, pos, d = self.heap, self.key, self.pos, self.d
+        item = heap[i]
+        k = key[item]
+        while i > 0:
+            parent = (i - 1) // d
+            p_item = heap[parent]
+            if key[p_item] <= k:
+                break
+            heap[i] = p_item
+            pos[p_item] = i
+            i = parent
+        heap[i] = item
+        pos[item] = i
+
+    def _sift_down(self, i):
+        heap, key, pos, d = self.heap, self.key, self.pos, self.d
+        n = len(heap)
+        item = heap[i]
+        k = key[item]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            best = first
+            best_key = key[heap[first]]
+            for c in range(first + 1, min(first + d, n)):
+                c_key = key[heap[c]]
+                if c_key < best_key:
+                    best = c
+                    best_key = c_key
+            if best_key >= k:
+                break
+            heap[i] = heap[best]
+            pos[heap[i]] = i
+            i = best
+        heap[i] = item
+        pos[item] = i
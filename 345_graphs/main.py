@@ -3,15 +3,25 @@ import numpy as np
 from graph_algorithms.utils.Graph import Graph
 from graph_algorithms.utils.timer import time_function
 from graph_algorithms.algorithms import dfs, bfs, dijkstra, floyd, prim, kruskal
-import matplotlib.pyplot as plt
-from prettytable import PrettyTable
+import argparse
 import os
 
 SAVE_DIR = "benchmark_figures"
-os.makedirs(SAVE_DIR, exist_ok=True)
 
 
-def plot_results(res, num_nodes_lst, title, graph_name, colors=plt.cm.tab10.colors):
+def get_pyplot():
+    # plotting is only imported when a report is drawn, figures always go to files
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def plot_results(res, num_nodes_lst, title, graph_name, colors=None, save_dir=SAVE_DIR):
+    plt = get_pyplot()
+    if colors is None:
+        colors = plt.cm.tab10.colors
+    os.makedirs(save_dir, exist_ok=True)
     plt.figure(figsize=(10, 6))
 
     file_name = ""
@@ -22,7 +32,7 @@ def plot_results(res, num_nodes_lst, title, graph_name, colors=plt.cm.tab10.colo
         plt.plot(num_nodes_lst, res_lst, label=algo_name, color=color, linewidth=2)
 
     file_name += graph_name.replace(" ", "_")
-    file_path = os.path.join(SAVE_DIR, file_name)
+    file_path = os.path.join(save_dir, file_name)
 
     plt.title(title)
     plt.xlabel("Number of Nodes", fontsize=12)
@@ -36,6 +46,8 @@ def plot_results(res, num_nodes_lst, title, graph_name, colors=plt.cm.tab10.colo
 
 
 def print_table(results, algos, sizes):
+    from prettytable import PrettyTable
+
     table = PrettyTable()
     table.clear()
     table.title = f"{algos[0].upper()} and {algos[1].upper()} comparison"
@@ -53,7 +65,7 @@ def print_table(results, algos, sizes):
     print(table)
 
 
-def benchmark(graph_name, graph_gen, graph_sizes, algo1, algo2, algo3, algo4, algo5, algo6):
+def benchmark(graph_name, graph_gen, graph_sizes, algo1, algo2, algo3, algo4, algo5, algo6, save_dir=SAVE_DIR):
 
     results12 = {
         algo1.__name__: [],
@@ -96,13 +108,44 @@ def benchmark(graph_name, graph_gen, graph_sizes, algo1, algo2, algo3, algo4, al
         timer, _ = time_function(algo6, graph, num_nodes)
         results56[algo6.__name__].append(timer)
 
-    colors = plt.cm.tab10.colors
-    plot_results(results12, graph_sizes, f"{algo1.__name__.upper()} and {algo2.__name__.upper()} on {graph_name} graph", graph_name, colors=colors[0:2])
-    plot_results(results34, graph_sizes, f"{algo3.__name__.upper()} and {algo4.__name__.upper()} on {graph_name} graph", graph_name, colors=colors[2:4])
-    plot_results(results56, graph_sizes, f"{algo5.__name__.upper()} and {algo6.__name__.upper()} on {graph_name} graph", graph_name, colors=colors[4:6])
+    colors = get_pyplot().cm.tab10.colors
+    plot_results(results12, graph_sizes, f"{algo1.__name__.upper()} and {algo2.__name__.upper()} on {graph_name} graph", graph_name, colors=colors[0:2], save_dir=save_dir)
+    plot_results(results34, graph_sizes, f"{algo3.__name__.upper()} and {algo4.__name__.upper()} on {graph_name} graph", graph_name, colors=colors[2:4], save_dir=save_dir)
+    plot_results(results56, graph_sizes, f"{algo5.__name__.upper()} and {algo6.__name__.upper()} on {graph_name} graph", graph_name, colors=colors[4:6], save_dir=save_dir)
     return results12, results34, results56
 
 
+def benchmark_heap_arity(graph_name, graph_gen, graph_sizes, arities=(2, 4, 8), save_dir=SAVE_DIR):
+    # dijkstra and prim share one indexed d-ary heap, time both for every arity
+    results = {f"{algo.__name__}_d{d}": [] for algo in (dijkstra, prim) for d in arities}
+
+    for size in graph_sizes:
+        g = Graph()
+        graph_gen(g, size)
+        graph = g.get_graph()
+        num_nodes = len(graph.keys())
+
+        for algo in (dijkstra, prim):
+            for d in arities:
+                timer, _ = time_function(algo, graph, num_nodes, d=d)
+                results[f"{algo.__name__}_d{d}"].append(timer)
+
+    plot_results(results, graph_sizes, f"Heap arity on {graph_name} graph", f"heap_arity_{graph_name}", save_dir=save_dir)
+    return results
+
+
+def print_arity_table(results, sizes):
+    from prettytable import PrettyTable
+
+    table = PrettyTable()
+    table.title = "Indexed heap arity comparison"
+    table.field_names = ["Graph Type", "Algo"] + [str(s) for s in sizes]
+    for graph, res in results.items():
+        for algo, times in res.items():
+            table.add_row([graph, algo] + [f"{t:.6f}" for t in times])
+    print(table)
+
+
 def print_aggregated_results(results, sizes):
     aggregated_results = {}
     graph_num = 0
@@ -117,6 +160,8 @@ def print_aggregated_results(results, sizes):
     for algo, res in aggregated_results.items():
         aggregated_results[algo] /= graph_num
 
+    from prettytable import PrettyTable
+
     table = PrettyTable()
     table.clear()
     table.title = "Aggregated results"
@@ -131,7 +176,7 @@ def print_aggregated_results(results, sizes):
     print(table)
 
 
-def main():
+def main(save_dir=SAVE_DIR):
     graph_generators = {
         "Sparse": lambda g, size: g.sparse(size),
         "Dense": lambda g, size: g.dense(size),
@@ -155,7 +200,7 @@ def main():
     results = {}
 
     for name, gen in graph_generators.items():
-        results[name] = benchmark(name, gen, sizes, bfs, dfs, dijkstra, floyd, prim, kruskal)
+        results[name] = benchmark(name, gen, sizes, bfs, dfs, dijkstra, floyd, prim, kruskal, save_dir=save_dir)
 
     print_table(results, algos=['bfs', 'dfs'], sizes=sizes)
     print_table(results, algos=['dijkstra', 'floyd'], sizes=sizes)
@@ -163,6 +208,18 @@ def main():
 
     print_aggregated_results(results=results, sizes=sizes)
 
+    arity_results = {}
+    for name in ("Dense", "Complete"):
+        arity_results[name] = benchmark_heap_arity(name, graph_generators[name], sizes, save_dir=save_dir)
+    print_arity_table(arity_results, sizes)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Graph algorithms benchmark")
+    parser.add_argument("--output-dir", default=SAVE_DIR, help="directory for the benchmark figures")
+    return parser.parse_args()
+
 
 if __name__ == '__main__':
-    main()
+    args = parse_args()
+    main(save_dir=args.output_dir)